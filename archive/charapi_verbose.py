@@ -1,10 +1,19 @@
 import sys
 sys.path.insert(0, "/Users/pitosalas/mydev/charapi")
 
-import csv
+import argparse
+import hashlib
+import os
+import pickle
+import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from charapi import evaluate_charity
 from charapi.data.charity_evaluation_result import MetricCategory, MetricStatus
 
+MAX_WORKERS = 32
+CACHE_DIR = os.path.expanduser("~/.cache/fidchar/charapi")
+
 def status_symbol(status):
     if status == MetricStatus.OUTSTANDING:
         return "⭐"
@@ -15,54 +24,89 @@ def status_symbol(status):
     else:
         return "?"
 
-def print_metrics_table(metrics, category_name, file):
-    category_metrics = [m for m in metrics if m.category.value == category_name]
+def metrics_table_lines(category_metrics, category_name):
     if not category_metrics:
-        return
+        return []
 
-    print(f"\n{category_name.upper().replace('_', ' ')}", file=file)
-    print(f"  {'Metric':<30} {'Value':<20} {'Range':<20} {'Status':<15}", file=file)
-    print(f"  {'-'*30} {'-'*15} {'-'*20} {'-'*15}", file=file)
+    lines = [
+        f"\n{category_name.upper().replace('_', ' ')}",
+        f"  {'Metric':<30} {'Value':<20} {'Range':<20} {'Status':<15}",
+        f"  {'-'*30} {'-'*15} {'-'*20} {'-'*15}"
+    ]
 
     for metric in category_metrics:
         symbol = status_symbol(metric.status)
         status_text = f"{symbol} {metric.status.value.title()}"
         range_text = f"{metric.ranges.outstanding}/{metric.ranges.acceptable}" if metric.ranges else ""
-        print(f"  {metric.name:<30} {metric.display_value:<15} {range_text:<20} {status_text:<15}", file=file)
+        lines.append(f"  {metric.name:<30} {metric.display_value:<15} {range_text:<20} {status_text:<15}")
+    return lines
 
 def extract_unique_eins(csv_path):
-    eins = set()
-    with open(csv_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            ein = row.get("Tax ID", "").strip()
-            if ein:
-                eins.add(ein)
-    return sorted(eins)
-
-def write_charity_report(result, file):
-    print(f"\nEvaluating charity with EIN: {result.ein}", file=file)
-    print("=" * 80, file=file)
-
-    print(f"\n{result.organization_name}", file=file)
-    print(f"EIN: {result.ein}", file=file)
-
-    print(f"\n{'SUMMARY'}", file=file)
-    print(f"{result.summary}", file=file)
-
-    print_metrics_table(result.metrics, "financial", file)
-    print_metrics_table(result.metrics, "compliance", file)
-    print_metrics_table(result.metrics, "organization_type", file)
-    print_metrics_table(result.metrics, "validation", file)
-    print_metrics_table(result.metrics, "preference", file)
-
-    print(f"\nOVERALL ASSESSMENT", file=file)
-    print(f"  ⭐ Outstanding:    {result.outstanding_count} metrics ({result.outstanding_count/result.total_metrics*100:.0f}%)", file=file)
-    print(f"  ✓ Acceptable:     {result.acceptable_count} metrics ({result.acceptable_count/result.total_metrics*100:.0f}%)", file=file)
-    print(f"  ⚠ Unacceptable:   {result.unacceptable_count} metrics ({result.unacceptable_count/result.total_metrics*100:.0f}%)", file=file)
-    print("\n" + "=" * 80, file=file)
+    # The C parser reads just the Tax ID column and dedupes it without per-row dicts
+    try:
+        eins = pd.read_csv(csv_path, usecols=["Tax ID"], dtype="string")["Tax ID"]
+    except ValueError:  # no Tax ID column
+        return []
+    eins = eins.str.strip().dropna()
+    return sorted(eins[eins != ""].unique().tolist())
+
+def config_hash(config_path):
+    with open(config_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def evaluate_charity_cached(ein, config_path, config_digest, use_cache=True):
+    # Results are keyed by EIN and config contents, so editing the config
+    # invalidates them; use_cache=False forces a fresh evaluation
+    path = os.path.join(CACHE_DIR, f"{ein}-{config_digest[:16]}.pkl")
+    if use_cache:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            pass
+
+    result = evaluate_charity(ein, config_path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        pickle.dump(result, f)
+    os.replace(path + ".tmp", path)
+    return result
+
+def build_charity_report(result):
+    # The whole block is built in memory so each charity costs one write
+    lines = [
+        f"\nEvaluating charity with EIN: {result.ein}",
+        "=" * 80,
+        f"\n{result.organization_name}",
+        f"EIN: {result.ein}",
+        f"\n{'SUMMARY'}",
+        f"{result.summary}"
+    ]
+
+    # Bucket the metrics in one pass rather than rescanning them per category
+    by_category = defaultdict(list)
+    for metric in result.metrics:
+        by_category[metric.category.value].append(metric)
+
+    for category_name in ("financial", "compliance", "organization_type", "validation", "preference"):
+        lines.extend(metrics_table_lines(by_category[category_name], category_name))
+
+    # A charity with no metrics reports 0% rather than failing on the division
+    scale = 100.0 / (result.total_metrics or 1)
+    lines += [
+        f"\nOVERALL ASSESSMENT",
+        f"  ⭐ Outstanding:    {result.outstanding_count} metrics ({result.outstanding_count*scale:.0f}%)",
+        f"  ✓ Acceptable:     {result.acceptable_count} metrics ({result.acceptable_count*scale:.0f}%)",
+        f"  ⚠ Unacceptable:   {result.unacceptable_count} metrics ({result.unacceptable_count*scale:.0f}%)",
+        "\n" + "=" * 80
+    ]
+    return "\n".join(lines) + "\n"
 
 def main():
+    parser = argparse.ArgumentParser(description="Evaluate every charity in data.csv")
+    parser.add_argument("--no-cache", action="store_true", help="re-evaluate charities instead of using cached results")
+    args = parser.parse_args()
+
     config_path = "/Users/pitosalas/mydev/charapi/charapi/config/config.yaml"
     csv_path = "data.csv"
     output_path = "charity_evaluations.txt"
@@ -70,6 +114,7 @@ def main():
     print(f"Reading EINs from {csv_path}...")
     eins = extract_unique_eins(csv_path)
     print(f"Found {len(eins)} unique EINs")
+    config_digest = config_hash(config_path)
 
     successful = 0
     failed = 0
@@ -82,19 +127,24 @@ def main():
         print(f"Total charities: {len(eins)}", file=f)
         print("=" * 80, file=f)
 
-        for i, ein in enumerate(eins, 1):
-            print(f"Evaluating {i}/{len(eins)}: {ein}", flush=True)
-            try:
-                result = evaluate_charity(ein, config_path)
-                write_charity_report(result, f)
-                successful += 1
-            except Exception as e:
-                print(f"  ERROR: {str(e)}", flush=True)
-                failed += 1
-                failed_eins.append(ein)
-                print(f"\nERROR evaluating EIN: {ein}", file=f)
-                print(f"Error: {str(e)}", file=f)
-                print("=" * 80, file=f)
+        # evaluate_charity is network-bound, so run the lookups concurrently;
+        # results are still collected and written in EIN order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(evaluate_charity_cached, ein, config_path, config_digest, not args.no_cache)
+                       for ein in eins]
+            for i, (ein, future) in enumerate(zip(eins, futures), 1):
+                print(f"Evaluating {i}/{len(eins)}: {ein}", flush=True)
+                try:
+                    result = future.result()
+                    f.write(build_charity_report(result))
+                    successful += 1
+                except Exception as e:
+                    print(f"  ERROR: {str(e)}", flush=True)
+                    failed += 1
+                    failed_eins.append(ein)
+                    print(f"\nERROR evaluating EIN: {ein}", file=f)
+                    print(f"Error: {str(e)}", file=f)
+                    print("=" * 80, file=f)
 
     print(f"\nReport written to {output_path}")
     print(f"Successful: {successful}, Failed: {failed}")
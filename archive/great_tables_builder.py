@@ -50,14 +50,13 @@ def create_gt_category_table(category_totals, total_amount):
 
 def create_gt_yearly_table(yearly_amounts, yearly_counts):
     """Create yearly analysis table using Great Tables"""
-    # Convert to DataFrame
-    yearly_data = []
-    for year in sorted(yearly_amounts.index):
-        amount = yearly_amounts[year]
-        count = yearly_counts[year]
-        yearly_data.append([year, amount, count])
-
-    df = pd.DataFrame(yearly_data, columns=["Year", "Total Amount", "Number of Donations"])
+    # Convert to DataFrame, sorting the years once
+    amounts = yearly_amounts.sort_index()
+    df = pd.DataFrame({
+        "Year": amounts.index,
+        "Total Amount": amounts.to_numpy(),
+        "Number of Donations": yearly_counts.reindex(amounts.index).to_numpy()
+    })
 
     gt_table = (
         GT(df)
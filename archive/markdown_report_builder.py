@@ -38,8 +38,8 @@ class MarkdownReportBuilder(BaseReportBuilder):
         """Generate category totals table using MarkdownRenderer"""
         df = category_totals.reset_index()
         df.columns = ['Charitable Sector', 'Total Amount']
-        df['Percentage'] = (df['Total Amount'] / total_amount * 100).apply(lambda x: f"{x:.1f}%")
-        df['Total Amount'] = df['Total Amount'].apply(lambda x: f"${x:,.0f}")
+        df['Percentage'] = (df['Total Amount'] / total_amount * 100).map("{:.1f}%".format)
+        df['Total Amount'] = df['Total Amount'].map("${:,.0f}".format)
 
         table = ReportTable.from_dataframe(
             df,
@@ -49,10 +49,11 @@ class MarkdownReportBuilder(BaseReportBuilder):
 
     def generate_yearly_table(self, yearly_amounts, yearly_counts):
         """Generate yearly analysis table using MarkdownRenderer"""
+        amounts = yearly_amounts.sort_index()
         df = pd.DataFrame({
-            'Year': sorted(yearly_amounts.index),
-            'Total Amount': [f"${yearly_amounts[year]:,.0f}" for year in sorted(yearly_amounts.index)],
-            'Number of Donations': [yearly_counts[year] for year in sorted(yearly_amounts.index)]
+            'Year': amounts.index,
+            'Total Amount': amounts.map("${:,.0f}".format).to_numpy(),
+            'Number of Donations': yearly_counts.reindex(amounts.index).to_numpy()
         })
 
         table = ReportTable.from_dataframe(
@@ -65,7 +66,7 @@ class MarkdownReportBuilder(BaseReportBuilder):
         """Generate top charities table using MarkdownRenderer"""
         augmented = self.prepare_top_charities_data(top_charities)
         df_for_table = augmented.reset_index()[['Organization', 'Amount_Numeric', 'is_focus']]
-        df_for_table['Amount_Numeric'] = df_for_table['Amount_Numeric'].apply(lambda x: f"${x:,.0f}")
+        df_for_table['Amount_Numeric'] = df_for_table['Amount_Numeric'].map("${:,.0f}".format)
         df_for_table.columns = ['Organization', 'Total Amount', 'FOCUS']
 
         table = ReportTable.from_dataframe(
@@ -78,7 +79,7 @@ class MarkdownReportBuilder(BaseReportBuilder):
     def generate_one_time_table(self, one_time, max_shown=20):
         """Generate one-time donations table using MarkdownRenderer"""
         df = one_time.head(max_shown).reset_index()[['Organization_Name', 'Total_Amount', 'First_Date']]
-        df['Total_Amount'] = df['Total_Amount'].apply(lambda x: f"${x:,.2f}")
+        df['Total_Amount'] = df['Total_Amount'].map("${:,.2f}".format)
         df['First_Date'] = df['First_Date'].dt.strftime("%m/%d/%Y")
         df.columns = ['Organization', 'Amount', 'Date']
 
@@ -92,7 +93,7 @@ class MarkdownReportBuilder(BaseReportBuilder):
         """Generate stopped recurring table using MarkdownRenderer"""
         df = stopped_recurring.head(max_shown).reset_index()[
             ['Organization_Name', 'Total_Amount', 'Donation_Count', 'First_Date', 'Last_Date']]
-        df['Total_Amount'] = df['Total_Amount'].apply(lambda x: f"${x:,.2f}")
+        df['Total_Amount'] = df['Total_Amount'].map("${:,.2f}".format)
         df['First_Date'] = df['First_Date'].dt.strftime("%m/%d/%Y")
         df['Last_Date'] = df['Last_Date'].dt.strftime("%m/%d/%Y")
         df.columns = ['Organization', 'Total Amount', 'Donations', 'First Date', 'Last Date']
@@ -206,18 +207,14 @@ class MarkdownReportBuilder(BaseReportBuilder):
 
 """
 
-        # Build DataFrame from rows
-        df_data = []
-        for row in data['rows']:
-            last_date_str = row['last_date'].strftime('%Y-%m-%d') if row['last_date'] else 'N/A'
-            df_data.append({
-                'EIN': row['ein'],
-                'Organization': row['organization'],
-                'Total Donated': f"${row['total_donated']:,.2f}",
-                'Last Donation': last_date_str
-            })
-
-        df = pd.DataFrame(df_data)
+        # Build DataFrame from parallel column lists, skipping per-row dicts
+        rows = data['rows']
+        df = pd.DataFrame({
+            'EIN': [row['ein'] for row in rows],
+            'Organization': [row['organization'] for row in rows],
+            'Total Donated': [f"${row['total_donated']:,.2f}" for row in rows],
+            'Last Donation': [row['last_date'].strftime('%Y-%m-%d') if row['last_date'] else 'N/A' for row in rows]
+        })
 
         table = ReportTable.from_dataframe(
             df,
@@ -304,7 +301,7 @@ class MarkdownReportBuilder(BaseReportBuilder):
 
         report += "\n### Detailed Donation History\n\n"
 
-        for i, (tax_id, _) in enumerate(top_charities.iterrows(), 1):
+        for i, tax_id in enumerate(top_charities.index, 1):
             report += self.generate_charity_card(i, tax_id)
 
         with open("../output/donation_analysis.md", "w") as f:
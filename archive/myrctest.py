@@ -1,5 +1,6 @@
+import io
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import List, Optional, TextIO, Union
 import pandas as pd
 
 # -----------------------------
@@ -18,14 +19,30 @@ class ReportTable:
     def from_dataframe(cls, df: pd.DataFrame, title: Optional[str] = None,
                        footnotes: Optional[List[str]] = None, source: Optional[str] = None,
                        focus_column: Optional[str] = None):
-        df = df.copy()
-        focus_flags = df[focus_column].tolist() if focus_column and focus_column in df.columns else [False] * len(df)
-        if focus_column:
-            df.drop(columns=[focus_column], inplace=True)
+        columns = [c for c in df.columns if c != focus_column]
+        focus_flags = df[focus_column].to_numpy().tolist() if focus_column and focus_column in df.columns else [False] * len(df)
+        rows = [list(row) for row in df[columns].itertuples(index=False, name=None)]
         return cls(
             title=title,
-            columns=list(df.columns),
-            rows=df.values.tolist(),
+            columns=columns,
+            rows=rows,
+            footnotes=footnotes,
+            source=source,
+            focus_flags=focus_flags
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict, title: Optional[str] = None,
+                  footnotes: Optional[List[str]] = None, source: Optional[str] = None,
+                  focus_column: Optional[str] = None):
+        columns = [c for c in data if c != focus_column]
+        n = len(data[columns[0]]) if columns else 0
+        focus_flags = list(data[focus_column]) if focus_column and focus_column in data else [False] * n
+        rows = [list(row) for row in zip(*(data[c] for c in columns))]
+        return cls(
+            title=title,
+            columns=columns,
+            rows=rows,
             footnotes=footnotes,
             source=source,
             focus_flags=focus_flags
@@ -49,11 +66,12 @@ class TextRenderer(TableRenderer):
             lines.append("=" * len(table.title))
         lines.append(" | ".join(table.columns))
         lines.append("-" * len(lines[-1]))
+        focus_flags = table.focus_flags
         for i, row in enumerate(table.rows):
-            row_copy = row.copy()
-            if table.focus_flags[i]:
-                row_copy[0] += " [FOCUS]"  # Organization column
-            lines.append(" | ".join(str(cell) for cell in row_copy))
+            cells = [str(cell) for cell in row]
+            if focus_flags[i]:
+                cells[0] += " [FOCUS]"  # Organization column
+            lines.append(" | ".join(cells))
         if table.footnotes:
             lines.append("\nFootnotes:")
             for i, note in enumerate(table.footnotes, 1):
@@ -72,11 +90,12 @@ class MarkdownRenderer(TableRenderer):
             lines.append(f"## {table.title}")
         lines.append("| " + " | ".join(table.columns) + " |")
         lines.append("| " + " | ".join("---" for _ in table.columns) + " |")
+        focus_flags = table.focus_flags
         for i, row in enumerate(table.rows):
-            row_copy = row.copy()
-            if table.focus_flags[i]:
-                row_copy[0] += " **[FOCUS]**"
-            lines.append("| " + " | ".join(str(cell) for cell in row_copy) + " |")
+            cells = [str(cell) for cell in row]
+            if focus_flags[i]:
+                cells[0] += " **[FOCUS]**"
+            lines.append("| " + " | ".join(cells) + " |")
         if table.footnotes:
             lines.append("\n**Footnotes**")
             for i, note in enumerate(table.footnotes, 1):
@@ -89,10 +108,16 @@ class MarkdownRenderer(TableRenderer):
 # 🌐 HTML Renderer (Bootstrap)
 # -----------------------------
 class HTMLRenderer(TableRenderer):
-    def render(self, table: ReportTable) -> str:
-        html = []
+    def render(self, table: ReportTable, out: Optional[TextIO] = None) -> Optional[str]:
+        """Render the table as a Bootstrap page.
+
+        If out is given, fragments are written to it as they are produced and
+        None is returned; otherwise the page is returned as a string.
+        """
+        buffer = out if out is not None else io.StringIO()
+        write = buffer.write
 
-        html.append(f"""<!DOCTYPE html>
+        write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -101,36 +126,34 @@ class HTMLRenderer(TableRenderer):
 </head>
 <body>
 <div class="container my-4">
-""")
+\n""")
 
         if table.title:
-            html.append(f"<h2 class='mb-4'>{table.title}</h2>")
-
-        html.append("<div class='table-responsive'>")
-        html.append("<table class='table table-bordered table-striped'>")
-        html.append("<thead class='table-dark'><tr>" + "".join(f"<th>{col}</th>" for col in table.columns) + "</tr></thead>")
-        html.append("<tbody>")
+            write(f"<h2 class='mb-4'>{table.title}</h2>\n")
+
+        write("<div class='table-responsive'>\n")
+        write("<table class='table table-bordered table-striped'>\n")
+        write("<thead class='table-dark'><tr>" + "".join(f"<th>{col}</th>" for col in table.columns) + "</tr></thead>\n")
+        write("<tbody>\n")
+        focus_flags = table.focus_flags
+        focus_cell = "<td>%s <span class='badge bg-warning text-dark ms-2'>FOCUS</span></td>"
         for i, row in enumerate(table.rows):
-            row_cells = []
-            for j, cell in enumerate(row):
-                if j == 0 and table.focus_flags[i]:  # Organization column
-                    cell = f"{cell} <span class='badge bg-warning text-dark ms-2'>FOCUS</span>"
-                row_cells.append(f"<td>{cell}</td>")
-            html.append("<tr>" + "".join(row_cells) + "</tr>")
-        html.append("</tbody></table>")
-        html.append("</div>")
+            first = (focus_cell if focus_flags[i] else "<td>%s</td>") % (row[0],)  # Organization column
+            write("<tr>" + first + "".join(["<td>%s</td>" % (cell,) for cell in row[1:]]) + "</tr>\n")
+        write("</tbody></table>\n")
+        write("</div>\n")
 
         if table.footnotes:
-            html.append("<div class='mt-4'><strong>Footnotes:</strong><ul>")
+            write("<div class='mt-4'><strong>Footnotes:</strong><ul>\n")
             for note in table.footnotes:
-                html.append(f"<li>{note}</li>")
-            html.append("</ul></div>")
+                write(f"<li>{note}</li>\n")
+            write("</ul></div>\n")
 
         if table.source:
-            html.append(f"<div class='mt-2'><em>Source: {table.source}</em></div>")
+            write(f"<div class='mt-2'><em>Source: {table.source}</em></div>\n")
 
-        html.append("</div></body></html>")
-        return "\n".join(html)
+        write("</div></body></html>")
+        return None if out is not None else buffer.getvalue()
 
 # -----------------------------
 # 🚀 Main Execution
@@ -171,10 +194,8 @@ if __name__ == "__main__":
         ]
     }
 
-    df = pd.DataFrame(data)
-
-    table = ReportTable.from_dataframe(
-        df,
+    table = ReportTable.from_dict(
+        data,
         title="Top 15 Charities by Total Donations",
         footnotes=["FOCUS organizations are marked with a yellow badge next to their name."],
         source="Uploaded table image",
@@ -183,11 +204,15 @@ if __name__ == "__main__":
 
     outputs = {
         "t1.txt": TextRenderer().render(table),
-        "t1.md": MarkdownRenderer().render(table),
-        "t1.html": HTMLRenderer().render(table)
+        "t1.md": MarkdownRenderer().render(table)
     }
 
     for filename, content in outputs.items():
         with open(filename, "w", encoding="utf-8") as f:
             f.write(content)
-        print(f"Saved: {filename}")
\ No newline at end of file
+        print(f"Saved: {filename}")
+
+    # Stream the HTML page straight to disk rather than building it in memory
+    with open("t1.html", "w", encoding="utf-8", buffering=1 << 20) as f:
+        HTMLRenderer().render(table, f)
+    print("Saved: t1.html")
\ No newline at end of file
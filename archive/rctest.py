@@ -20,7 +20,7 @@ rows = [
 ]
 
 # Build HTML table manually
-table_html = """
+TABLE_HEADER = """
 <table style="width:100%; border-collapse:collapse;">
   <thead>
     <tr style="background-color:#f2f2f2;">
@@ -33,21 +33,23 @@ table_html = """
   <tbody>
 """
 
-for rank, org, amount, tax_id, is_focus in rows:
-    badge = (
-        '<span style="background-color:gold; color:black; padding:2px 6px; border-radius:4px; font-size:0.8em; font-weight:bold; margin-left:6px;">FOCUS</span>'
-        if is_focus else ""
-    )
-    table_html += f"""
+FOCUS_BADGE = '<span style="background-color:gold; color:black; padding:2px 6px; border-radius:4px; font-size:0.8em; font-weight:bold; margin-left:6px;">FOCUS</span>'
+
+ROW_TEMPLATE = """
     <tr>
-      <td style="padding:8px;">{rank}</td>
-      <td style="padding:8px;">{org} {badge}</td>
-      <td style="padding:8px;">{amount}</td>
-      <td style="padding:8px;">{tax_id}</td>
+      <td style="padding:8px;">{}</td>
+      <td style="padding:8px;">{} {}</td>
+      <td style="padding:8px;">{}</td>
+      <td style="padding:8px;">{}</td>
     </tr>
     """
 
-table_html += "</tbody></table>"
+parts = [TABLE_HEADER]
+for rank, org, amount, tax_id, is_focus in rows:
+    parts.append(ROW_TEMPLATE.format(rank, org, FOCUS_BADGE if is_focus else "", amount, tax_id))
+parts.append("</tbody></table>")
+
+table_html = "".join(parts)
 
 # Generate the report
 with rc.ReportCreator(title="Top 15 Charities by Total Donations", description="A ranked list of charitable organizations by donation amount") as report:
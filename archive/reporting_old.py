@@ -4,15 +4,44 @@
 Handles API calls, report generation, and file output.
 """
 
+import json
+import os
 import requests
 import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tabulate import tabulate
+
+DESCRIPTION_CACHE_PATH = os.path.expanduser("~/.cache/fidchar/charity_descriptions.json")
+DESCRIPTION_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+MAX_DESCRIPTION_WORKERS = 8
+MAX_RETRIES = 3  # retries after a 429 or 5xx answer
+MAX_RETRY_AFTER = 60  # cap on a server-requested wait, in seconds
+
+# Shared HTTP session so calls reuse pooled keep-alive connections; the pool
+# is sized to the worker count so no concurrent request opens a throwaway one
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_DESCRIPTION_WORKERS))
+
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying, or None if the response should not be retried"""
+    if response.status_code == 429:
+        try:
+            return min(float(response.headers.get("Retry-After", "1")), MAX_RETRY_AFTER)
+        except ValueError:
+            return 2 ** attempt
+    if response.status_code >= 500:
+        return 2 ** attempt
+    return None
 
 
 def get_charity_description(tax_id, app_id=None, app_key=None):
-    """Fetch charity description from Charity Navigator API"""
+    """Fetch charity description from Charity Navigator API
+
+    Calls are not throttled up front; a 429 waits for the server's Retry-After
+    and a 5xx backs off exponentially, up to MAX_RETRIES retries.
+    """
     if not app_id or not app_key:
         return "API credentials not configured"
 
@@ -27,7 +56,12 @@ def get_charity_description(tax_id, app_id=None, app_key=None):
             "app_key": app_key
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        for attempt in range(MAX_RETRIES + 1):
+            response = _SESSION.get(url, params=params, timeout=10)
+            delay = _retry_delay(response, attempt)
+            if delay is None or attempt == MAX_RETRIES:
+                break
+            time.sleep(delay)
 
         if response.status_code == 200:
             data = response.json()
@@ -59,17 +93,52 @@ def _extract_charity_mission(data):
     return "No description available"
 
 
+def _load_description_cache():
+    """Load cached descriptions from disk, dropping entries older than the TTL"""
+    try:
+        with open(DESCRIPTION_CACHE_PATH, "r") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    cutoff = time.time() - DESCRIPTION_CACHE_TTL
+    return {tax_id: entry for tax_id, entry in cache.items() if entry.get("fetched", 0) >= cutoff}
+
+
+def _save_description_cache(cache):
+    """Persist the description cache to disk"""
+    os.makedirs(os.path.dirname(DESCRIPTION_CACHE_PATH), exist_ok=True)
+    with open(DESCRIPTION_CACHE_PATH, "w") as f:
+        json.dump(cache, f)
+
+
 def get_charity_descriptions(top_charities, app_id=None, app_key=None):
-    """Fetch descriptions for all top charities"""
+    """Fetch descriptions for all top charities
+
+    Descriptions are cached on disk by Tax ID, so only charities missing from
+    the cache hit the API. Those requests run concurrently on a shared session.
+    """
+    cache = _load_description_cache()
     charity_descriptions = {}
+    to_fetch = []
 
     for tax_id in top_charities.index:
-        # Fetch charity description from API
-        description = get_charity_description(tax_id, app_id, app_key)
-        charity_descriptions[tax_id] = description
+        if tax_id in cache:
+            charity_descriptions[tax_id] = cache[tax_id]["description"]
+        else:
+            to_fetch.append(tax_id)
+
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=MAX_DESCRIPTION_WORKERS) as executor:
+            descriptions = executor.map(lambda tax_id: get_charity_description(tax_id, app_id, app_key), to_fetch)
+            fetched_at = time.time()
+            for tax_id, description in zip(to_fetch, descriptions):
+                charity_descriptions[tax_id] = description
+                # Only cache real answers, not credential or transport errors
+                if app_id and app_key and not description.startswith(("API error", "Error fetching")):
+                    cache[tax_id] = {"description": description, "fetched": fetched_at}
 
-        # Add small delay to be respectful to API
-        time.sleep(0.1)
+        _save_description_cache(cache)
 
     return charity_descriptions
 
@@ -91,88 +160,101 @@ def generate_console_report(category_totals):
     print(f"{'TOTAL':<25} ${total_amount:>10,.2f}")
 
 
+def _simple_table(headers, rows, aligns):
+    """Format rows as a plain-text table in tabulate's "simple" layout.
+
+    aligns holds "l" or "r" per column; pass "r" for the numeric columns
+    tabulate would right-align. As in tabulate, each column is at least two
+    characters wider than its header and lines carry no trailing spaces.
+    Column widths are computed in one pass.
+    """
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [len(str(header)) + 2 for header in headers]
+    for row in rows:
+        for j, cell in enumerate(row):
+            if len(cell) > widths[j]:
+                widths[j] = len(cell)
+
+    fmt = "  ".join(("{:<%d}" if align == "l" else "{:>%d}") % width for align, width in zip(aligns, widths))
+    lines = [fmt.format(*headers), "  ".join("-" * width for width in widths)]
+    lines.extend(fmt.format(*row) for row in rows)
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def _format_money(values):
+    """Format a column of amounts as $1,234.56 strings"""
+    return pd.Series(values).map("${:,.2f}".format).tolist()
+
+
 def create_category_summary_table(category_totals, total_amount):
-    """Create category totals table using tabulate"""
-    category_data = []
-    for category, amount in category_totals.items():
-        percentage = (amount / total_amount) * 100
-        category_data.append([category, f"${amount:,.2f}", f"{percentage:.1f}%"])
+    """Create category totals table"""
+    amounts = _format_money(category_totals.to_numpy())
+    percentages = ((category_totals / total_amount) * 100).map("{:.1f}%".format).tolist()
+    category_data = list(zip(category_totals.index, amounts, percentages))
 
-    category_table = tabulate(category_data,
-                            headers=["Charitable Sector", "Total Amount", "Percentage"],
-                            tablefmt="simple")
+    category_table = _simple_table(["Charitable Sector", "Total Amount", "Percentage"], category_data, ["l", "l", "l"])
 
     return category_table
 
 
 def create_yearly_analysis_table(yearly_amounts, yearly_counts):
-    """Create yearly analysis table using tabulate"""
-    yearly_data = []
-    for year in sorted(yearly_amounts.index):
-        amount = yearly_amounts[year]
-        count = yearly_counts[year]
-        yearly_data.append([year, f"${amount:,.2f}", count])
+    """Create yearly analysis table"""
+    years = sorted(yearly_amounts.index)
+    amounts = _format_money(yearly_amounts.loc[years].to_numpy())
+    counts = yearly_counts.loc[years].tolist()
+    yearly_data = list(zip(years, amounts, counts))
 
-    yearly_table = tabulate(yearly_data,
-                          headers=["Year", "Total Amount", "Number of Donations"],
-                          tablefmt="simple")
+    yearly_table = _simple_table(["Year", "Total Amount", "Number of Donations"], yearly_data, ["r", "l", "r"])
 
     return yearly_table
 
 
 def create_one_time_donations_table(one_time):
-    """Create one-time donations table using tabulate"""
-    one_time_data = []
-    for tax_id, data in one_time.head(20).iterrows():  # Show top 20
-        org_name = data["Organization_Name"]
-        one_time_data.append([org_name, f"${data['Total_Amount']:,.2f}", data["First_Date"].strftime("%m/%d/%Y")])
+    """Create one-time donations table"""
+    shown = one_time.head(20)  # Show top 20
+    one_time_data = list(zip(shown["Organization_Name"].to_numpy(),
+                             _format_money(shown["Total_Amount"].to_numpy()),
+                             shown["First_Date"].dt.strftime("%m/%d/%Y").to_numpy()))
 
-    one_time_table = tabulate(one_time_data,
-                            headers=["Organization", "Amount", "Date"],
-                            tablefmt="simple")
+    one_time_table = _simple_table(["Organization", "Amount", "Date"], one_time_data, ["l", "l", "l"])
 
     return one_time_table
 
 
 def create_stopped_recurring_table(stopped_recurring):
-    """Create stopped recurring donations table using tabulate"""
-    stopped_data = []
-    for tax_id, data in stopped_recurring.head(15).iterrows():  # Show top 15
-        org_name = data["Organization_Name"]
-        stopped_data.append([org_name, f"${data['Total_Amount']:,.2f}", data["Donation_Count"],
-                           data["First_Date"].strftime("%m/%d/%Y"), data["Last_Date"].strftime("%m/%d/%Y")])
+    """Create stopped recurring donations table"""
+    shown = stopped_recurring.head(15)  # Show top 15
+    stopped_data = list(zip(shown["Organization_Name"].to_numpy(),
+                            _format_money(shown["Total_Amount"].to_numpy()),
+                            shown["Donation_Count"].to_numpy(),
+                            shown["First_Date"].dt.strftime("%m/%d/%Y").to_numpy(),
+                            shown["Last_Date"].dt.strftime("%m/%d/%Y").to_numpy()))
 
-    stopped_table = tabulate(stopped_data,
-                           headers=["Organization", "Total Amount", "Donations", "First Date", "Last Date"],
-                           tablefmt="simple")
+    stopped_table = _simple_table(["Organization", "Total Amount", "Donations", "First Date", "Last Date"], stopped_data, ["l", "l", "r", "l", "l"])
 
     return stopped_table
 
 
 def create_top_charities_table(top_charities):
-    """Create top charities ranking table using tabulate"""
-    top_charities_data = []
-    for i, (tax_id, data) in enumerate(top_charities.iterrows(), 1):
-        org_name = data["Organization"]
-        tax_id_display = tax_id if pd.notna(tax_id) else "N/A"
-        top_charities_data.append([i, org_name, f"${data['Amount_Numeric']:,.2f}", tax_id_display])
+    """Create top charities ranking table"""
+    # Tax ID is categorical after read_donation_data, and a categorical cannot
+    # take "N/A" as a fill value, so fill on plain objects
+    tax_ids = top_charities.index.astype(object).to_series().fillna("N/A").to_numpy()
+    top_charities_data = list(zip(range(1, len(top_charities) + 1),
+                                  top_charities["Organization"].to_numpy(),
+                                  _format_money(top_charities["Amount_Numeric"].to_numpy()),
+                                  tax_ids))
 
-    top_charities_table = tabulate(top_charities_data,
-                                 headers=["Rank", "Organization", "Total Amount", "Tax ID"],
-                                 tablefmt="simple")
+    top_charities_table = _simple_table(["Rank", "Organization", "Total Amount", "Tax ID"], top_charities_data, ["r", "l", "l", "l"])
 
     return top_charities_table
 
 
 def create_donation_history_table(org_donations):
     """Create individual charity donation history table"""
-    donation_history_data = []
-    for _, donation in org_donations.iterrows():
-        donation_history_data.append([donation["Submit Date"].strftime("%m/%d/%Y"),
-                                    f"${donation['Amount_Numeric']:,.2f}"])
+    donation_history_data = list(zip(org_donations["Submit Date"].dt.strftime("%m/%d/%Y").to_numpy(),
+                                     _format_money(org_donations["Amount_Numeric"].to_numpy())))
 
-    donation_history_table = tabulate(donation_history_data,
-                                     headers=["Date", "Amount"],
-                                     tablefmt="simple")
+    donation_history_table = _simple_table(["Date", "Amount"], donation_history_data, ["l", "l"])
 
-    return donation_history_table
\ No newline at end of file
+    return donation_history_table
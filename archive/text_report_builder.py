@@ -38,8 +38,8 @@ Years Covered:    {self.df['Year'].min()} - {self.df['Year'].max()}
         """Generate category totals table using TextRenderer"""
         df = category_totals.reset_index()
         df.columns = ['Charitable Sector', 'Total Amount']
-        df['Percentage'] = (df['Total Amount'] / total_amount * 100).apply(lambda x: f"{x:.1f}%")
-        df['Total Amount'] = df['Total Amount'].apply(lambda x: f"${x:,.0f}")
+        df['Percentage'] = (df['Total Amount'] / total_amount * 100).map("{:.1f}%".format)
+        df['Total Amount'] = df['Total Amount'].map("${:,.0f}".format)
 
         table = ReportTable.from_dataframe(
             df,
@@ -49,10 +49,11 @@ Years Covered:    {self.df['Year'].min()} - {self.df['Year'].max()}
 
     def generate_yearly_table(self, yearly_amounts, yearly_counts):
         """Generate yearly analysis table using TextRenderer"""
+        amounts = yearly_amounts.sort_index()
         df = pd.DataFrame({
-            'Year': sorted(yearly_amounts.index),
-            'Total Amount': [f"${yearly_amounts[year]:,.0f}" for year in sorted(yearly_amounts.index)],
-            'Number of Donations': [yearly_counts[year] for year in sorted(yearly_amounts.index)]
+            'Year': amounts.index,
+            'Total Amount': amounts.map("${:,.0f}".format).to_numpy(),
+            'Number of Donations': yearly_counts.reindex(amounts.index).to_numpy()
         })
 
         table = ReportTable.from_dataframe(
@@ -65,7 +66,7 @@ Years Covered:    {self.df['Year'].min()} - {self.df['Year'].max()}
         """Generate top charities table using TextRenderer"""
         augmented = self.prepare_top_charities_data(top_charities)
         df_for_table = augmented.reset_index()[['Organization', 'Amount_Numeric', 'is_focus']]
-        df_for_table['Amount_Numeric'] = df_for_table['Amount_Numeric'].apply(lambda x: f"${x:,.0f}")
+        df_for_table['Amount_Numeric'] = df_for_table['Amount_Numeric'].map("${:,.0f}".format)
         df_for_table.columns = ['Organization', 'Total Amount', 'FOCUS']
 
         table = ReportTable.from_dataframe(
@@ -78,7 +79,7 @@ Years Covered:    {self.df['Year'].min()} - {self.df['Year'].max()}
     def generate_one_time_table(self, one_time, max_shown=20):
         """Generate one-time donations table using TextRenderer"""
         df = one_time.head(max_shown).reset_index()[['Organization_Name', 'Total_Amount', 'First_Date']]
-        df['Total_Amount'] = df['Total_Amount'].apply(lambda x: f"${x:,.2f}")
+        df['Total_Amount'] = df['Total_Amount'].map("${:,.2f}".format)
         df['First_Date'] = df['First_Date'].dt.strftime("%m/%d/%Y")
         df.columns = ['Organization', 'Amount', 'Date']
 
@@ -93,7 +94,7 @@ Years Covered:    {self.df['Year'].min()} - {self.df['Year'].max()}
         df = stopped_recurring.head(max_shown).reset_index()[
             ['Organization_Name', 'Total_Amount', 'Donation_Count', 'First_Date', 'Last_Date']
         ]
-        df['Total_Amount'] = df['Total_Amount'].apply(lambda x: f"${x:,.2f}")
+        df['Total_Amount'] = df['Total_Amount'].map("${:,.2f}".format)
         df['First_Date'] = df['First_Date'].dt.strftime("%m/%d/%Y")
         df['Last_Date'] = df['Last_Date'].dt.strftime("%m/%d/%Y")
         df.columns = ['Organization', 'Total Amount', 'Donations', 'First Date', 'Last Date']
@@ -187,34 +188,31 @@ No focus charities identified.
 
 """
 
-        section = f"""FOCUS CHARITIES SUMMARY
+        header = f"""FOCUS CHARITIES SUMMARY
 {'-' * 80}
 
 {data['count']} charities identified as strategic focus based on your donation patterns:
 
 """
 
-        # Build DataFrame from rows
-        df_data = []
-        for row in data['rows']:
-            last_date_str = row['last_date'].strftime('%Y-%m-%d') if row['last_date'] else 'N/A'
-            df_data.append({
-                'EIN': row['ein'],
-                'Organization': row['organization'][:40],
-                'Total Donated': f"${row['total_donated']:,.2f}",
-                'Last Donation': last_date_str
-            })
-
-        df = pd.DataFrame(df_data)
+        # Build DataFrame from parallel column lists, skipping per-row dicts
+        rows = data['rows']
+        df = pd.DataFrame({
+            'EIN': [row['ein'] for row in rows],
+            'Organization': [row['organization'][:40] for row in rows],
+            'Total Donated': [f"${row['total_donated']:,.2f}" for row in rows],
+            'Last Donation': [row['last_date'].strftime('%Y-%m-%d') if row['last_date'] else 'N/A' for row in rows]
+        })
 
         table = ReportTable.from_dataframe(
             df,
             title=None  # Title already in section header
         )
-        section += self.table_renderer.render(table)
-        section += f"\n\nTotal donated to focus charities: ${data['total']:,.2f}\n\n"
-
-        return section
+        return "".join([
+            header,
+            self.table_renderer.render(table),
+            f"\n\nTotal donated to focus charities: ${data['total']:,.2f}\n\n"
+        ])
 
     def generate_report(self, category_totals, yearly_amounts, yearly_counts, one_time,
                        stopped_recurring, top_charities):
@@ -222,7 +220,7 @@ No focus charities identified.
         total_amount = category_totals.sum()
         total_donations = len(self.df)
 
-        report = self.generate_report_header(total_amount, total_donations)
+        parts = [self.generate_report_header(total_amount, total_donations)]
 
         for section in self.config.get("sections", {}):
             section_id, section_options = self.parse_section_config(section)
@@ -230,71 +228,71 @@ No focus charities identified.
             if section_id == "exec":
                 pass
             elif section_id == "sectors":
-                report += f"""DONATIONS BY CHARITABLE SECTOR
+                parts.append(f"""DONATIONS BY CHARITABLE SECTOR
 {'-' * 80}
 
 {self.generate_category_table(category_totals, total_amount)}
 
 Total: ${total_amount:,.2f}
 
-"""
+""")
             elif section_id == "yearly":
-                report += f"""YEARLY ANALYSIS
+                parts.append(f"""YEARLY ANALYSIS
 {'-' * 80}
 
 Note: Charts available in images/yearly_amounts.png and images/yearly_counts.png
 
 {self.generate_yearly_table(yearly_amounts, yearly_counts)}
 
-"""
+""")
             elif section_id == "top_charities":
                 count = len(top_charities)
-                report += f"""TOP {count} CHARITIES BY TOTAL DONATIONS
+                parts.append(f"""TOP {count} CHARITIES BY TOTAL DONATIONS
 {'-' * 80}
 
 {self.generate_top_charities_table(top_charities)}
 
-"""
+""")
             elif section_id == "patterns":
                 one_time_total = one_time["Total_Amount"].sum()
                 stopped_total = stopped_recurring["Total_Amount"].sum()
 
-                report += f"""ONE-TIME DONATIONS
+                parts.append(f"""ONE-TIME DONATIONS
 {'-' * 80}
 
 Organizations that received a single donation ({len(one_time)} organizations):
 
 {self.generate_one_time_table(one_time)}
-"""
+""")
                 if len(one_time) > 20:
-                    report += f"\n... and {len(one_time) - 20} more organizations\n"
+                    parts.append(f"\n... and {len(one_time) - 20} more organizations\n")
 
-                report += f"\nOne-time donations total: ${one_time_total:,.2f}\n\n"
+                parts.append(f"\nOne-time donations total: ${one_time_total:,.2f}\n\n")
 
-                report += f"""STOPPED RECURRING DONATIONS
+                parts.append(f"""STOPPED RECURRING DONATIONS
 {'-' * 80}
 
 Organizations with recurring donations that appear to have stopped ({len(stopped_recurring)} organizations):
 
 {self.generate_stopped_table(stopped_recurring)}
-"""
+""")
                 if len(stopped_recurring) > 15:
-                    report += f"\n... and {len(stopped_recurring) - 15} more organizations\n"
+                    parts.append(f"\n... and {len(stopped_recurring) - 15} more organizations\n")
 
-                report += f"\nStopped recurring donations total: ${stopped_total:,.2f}\n\n"
+                parts.append(f"\nStopped recurring donations total: ${stopped_total:,.2f}\n\n")
 
             elif section_id == "focus_summary":
-                report += self.generate_focus_summary_section()
+                parts.append(self.generate_focus_summary_section())
             elif section_id == "detailed":
                 pass
 
-        report += f"""DETAILED DONATION HISTORY
+        parts.append(f"""DETAILED DONATION HISTORY
 {'=' * 80}
 
-"""
+""")
 
-        for i, (tax_id, _) in enumerate(top_charities.iterrows(), 1):
-            report += self.generate_charity_card(i, tax_id)
+        for i, tax_id in enumerate(top_charities.index, 1):
+            parts.append(self.generate_charity_card(i, tax_id))
 
         with open("../output/donation_analysis.txt", "w") as f:
-            f.write(report)
+            f.write("".join(parts))
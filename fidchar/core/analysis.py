@@ -4,35 +4,44 @@
 Handles all pandas groupby operations and statistical analysis.
 """
 
+import pandas as pd
 from datetime import datetime
 
 
 def analyze_by_category(df):
     """Group donations by charitable sector and calculate totals"""
-    category_totals = df.groupby("Charitable Sector")["Amount_Numeric"].sum().sort_values(ascending=False)
+    # The groupby's own key sort would be discarded by the sort by amount
+    category_totals = df.groupby("Charitable Sector", observed=True, sort=False)["Amount_Numeric"].sum().sort_values(ascending=False)
     return category_totals
 
 
 def analyze_by_year(df):
-    yearly_amounts = df.groupby("Year")["Amount_Numeric"].sum().sort_index()
-    yearly_counts = df.groupby("Year").size().sort_index()
+    # Sum and count from a single groupby so the year keys are hashed once
+    yearly = df.groupby("Year", sort=True)["Amount_Numeric"].agg(["sum", "size"])
+    yearly_amounts = yearly["sum"].rename("Amount_Numeric")
+    yearly_counts = yearly["size"].rename(None)
     return yearly_amounts, yearly_counts
 
 
 def analyze_donation_patterns(df):
     """Analyze one-time vs recurring donation patterns"""
     # Group by Tax ID to analyze donation patterns (same charity regardless of name variations)
-    org_donations = df.groupby("Tax ID").agg({
+    org_donations = df.groupby("Tax ID", observed=True, sort=False).agg({
         "Amount_Numeric": ["sum", "count"],
         "Submit Date": ["min", "max"],
         "Recurring": "first",
         "Organization": "first"  # Keep one organization name for display
-    }).round(2)
+    })
 
     org_donations.columns = ["Total_Amount", "Donation_Count", "First_Date", "Last_Date", "Recurring_Status", "Organization_Name"]
+    # Only the totals are shown with cents; rounding the whole frame would
+    # also pass over the counts, dates and names
+    org_donations["Total_Amount"] = org_donations["Total_Amount"].round(2)
 
     # One-time donations (single donation)
-    one_time = org_donations[org_donations["Donation_Count"] == 1].sort_values("Total_Amount", ascending=False)
+    # Equal totals are ordered by Tax ID, as the unsorted groupby gives file order
+    one_time = org_donations[org_donations["Donation_Count"] == 1].sort_values(
+        ["Total_Amount", "Tax ID"], ascending=[False, True])
 
     # Organizations with multiple donations that appear to have stopped
     # (multiple donations but last donation was more than 1 year ago and marked as recurring)
@@ -40,12 +49,26 @@ def analyze_donation_patterns(df):
     stopped_recurring = org_donations[
         (org_donations["Donation_Count"] > 1) &
         (org_donations["Last_Date"].dt.year < current_year - 1) &
-        (org_donations["Recurring_Status"].str.contains("annually|semi-annually", case=False, na=False))
-    ].sort_values("Total_Amount", ascending=False)
+        annual_recurring_mask(org_donations["Recurring_Status"])
+    ].sort_values(["Total_Amount", "Tax ID"], ascending=[False, True])
 
     return one_time, stopped_recurring
 
 
+def annual_recurring_mask(recurring_status):
+    """Flag Recurring values that are annual or semi-annual schedules.
+
+    The Recurring field is a small set of schedule names, so the match runs
+    once per distinct value and the rows are then tested with isin.
+    """
+    status = recurring_status.astype("category")
+    categories = status.cat.categories
+    # "semi-annually" contains "annually", so one literal substring test
+    # covers both schedules without compiling a regex
+    annual = categories[categories.astype(str).str.lower().str.contains("annually", regex=False)]
+    return status.isin(annual)
+
+
 def get_charities_basic(df, max_count=None):
     """Get charities by total donations, grouped by Tax ID
 
@@ -53,27 +76,36 @@ def get_charities_basic(df, max_count=None):
         df: DataFrame with donation data
         max_count: Optional maximum number of charities to return (None = all)
     """
-    charities = df.groupby("Tax ID").agg({
+    # Grouped in Tax ID order so that nlargest and the stable sort break ties
+    # between equal totals by Tax ID
+    charities = df.groupby("Tax ID", observed=True).agg({
         "Amount_Numeric": "sum",
         "Organization": "first"  # Keep one organization name for display
-    }).sort_values("Amount_Numeric", ascending=False)
+    })
 
+    # nlargest does a partial selection rather than sorting every charity
     if max_count:
-        charities = charities.head(max_count)
+        return charities.nlargest(max_count, "Amount_Numeric")
 
-    return charities
+    return charities.sort_values("Amount_Numeric", ascending=False, kind="stable")
 
 
 def get_charity_details(df, charities):
     """Get detailed donation history for each charity"""
-    charity_details = {}
+    columns = ["Submit Date", "Year", "Amount_Numeric", "Tax ID", "Charitable Sector", "Organization"]
+
+    # Sort the requested charities' rows once, then split them in one groupby
+    # pass rather than scanning and sorting the whole frame once per Tax ID;
+    # each group's positions keep the date order. The sort is stable so
+    # same-day donations stay in file order
+    selected = df.loc[df["Tax ID"].isin(charities.index), columns].sort_values("Submit Date", kind="stable")
+    positions = selected.groupby("Tax ID", observed=True, sort=False).indices
+    no_donations = selected.iloc[0:0]
 
+    charity_details = {}
     for tax_id in charities.index:
-        # Get all donations for this Tax ID
-        charity_data = df[df["Tax ID"] == tax_id][
-            ["Submit Date", "Amount_Numeric", "Tax ID", "Charitable Sector", "Organization"]
-        ].sort_values("Submit Date")
-        charity_details[tax_id] = charity_data
+        rows = positions.get(tax_id)
+        charity_details[tax_id] = no_donations if rows is None else selected.take(rows)
 
     return charity_details
 
@@ -89,33 +121,26 @@ def get_recurring_by_pattern(df, count, min_years, min_amount):
     current_year = datetime.now().year
     previous_year = current_year - 1
 
-    work = df.copy()
-    if 'Year' not in work.columns:
-        work['Year'] = work['Submit Date'].dt.year
+    # Only three columns are needed, so filter them directly instead of
+    # copying the whole frame
+    years = df['Year'] if 'Year' in df.columns else df['Submit Date'].dt.year.rename('Year')
+    in_window = years.between(current_year - count, current_year).to_numpy(dtype=bool, na_value=False)
+    years = years[in_window]
 
-    recent_years = list(range(current_year - count, current_year + 1))
-    work = work[work['Year'].isin(recent_years)]
+    # One groupby gives every charity's yearly totals; the per-charity rules
+    # below are then evaluated on that Series instead of re-filtering df per charity
+    yearly_totals = df.loc[in_window, 'Amount_Numeric'].groupby(
+        [df.loc[in_window, 'Tax ID'], years], observed=True, sort=False).sum()
+    qualifying = yearly_totals >= min_amount
 
-    recurring_charities = set()
+    qualifying_years = qualifying.groupby(level='Tax ID', observed=True, sort=False).sum()
+    enough_years = qualifying_years.index[qualifying_years >= min_years]
 
-    for tax_id in work['Tax ID'].dropna().unique():
-        charity_data = work[work['Tax ID'] == tax_id]
+    is_prev_year = yearly_totals.index.get_level_values('Year') == previous_year
+    prev_year_ok = qualifying[is_prev_year]
+    prev_year_ok = prev_year_ok.index.get_level_values('Tax ID')[prev_year_ok.to_numpy()]
 
-        prev_year_donations = charity_data[charity_data['Year'] == previous_year]
-        if prev_year_donations.empty:
-            continue
-
-        prev_year_total = prev_year_donations['Amount_Numeric'].sum()
-        if prev_year_total < min_amount:
-            continue
-
-        yearly_totals = charity_data.groupby('Year')['Amount_Numeric'].sum()
-        qualifying_years = sum(1 for amount in yearly_totals if amount >= min_amount)
-
-        if qualifying_years >= min_years:
-            recurring_charities.add(tax_id)
-
-    return recurring_charities
+    return set(enough_years.intersection(prev_year_ok))
 
 
 def get_recurring_by_csv_field(df):
@@ -127,7 +152,8 @@ def get_recurring_by_csv_field(df):
         return set()
 
     recurring_mask = df['Recurring'].notna() & (df['Recurring'].str.len() > 0)
-    recurring_tax_ids = set(df[recurring_mask]['Tax ID'].dropna().unique())
+    # Select just the Tax ID column rather than every column of the matching rows
+    recurring_tax_ids = set(df.loc[recurring_mask, 'Tax ID'].dropna().unique())
 
     return recurring_tax_ids
 
@@ -141,16 +167,26 @@ def get_csv_recurring_details(df):
         return None
 
     recurring_mask = df['Recurring'].notna() & (df['Recurring'].str.len() > 0)
-    recurring_df = df[recurring_mask].copy()
-
-    details = recurring_df.groupby('Tax ID').agg({
-        'Organization': 'first',
-        'Amount_Numeric': 'sum',
-        'Submit Date': 'count',
-        'Year': lambda x: ', '.join(sorted(set(str(y)[-2:] for y in x)))
-    }).round(2)
-
-    details.columns = ['Organization', 'Total', 'Count', 'Years']
-    details = details.sort_values('Total', ascending=False)
+    recurring_df = df[recurring_mask]
+
+    # Count is the group size, so no per-row null check on a date column
+    details = recurring_df.groupby('Tax ID', observed=True, sort=False).agg(
+        Organization=('Organization', 'first'),
+        Total=('Amount_Numeric', 'sum'),
+        Count=('Amount_Numeric', 'size')
+    )
+    details['Total'] = details['Total'].round(2)
+
+    # Two-digit year labels: dedupe and sort all (charity, year % 100) pairs
+    # as integers, then format only the distinct pairs, so each group only
+    # has to join its already-ordered labels
+    year_labels = pd.DataFrame({
+        'Tax ID': recurring_df['Tax ID'],
+        'Years': recurring_df['Year'] % 100
+    }).dropna().drop_duplicates().sort_values('Years')
+    year_labels['Years'] = year_labels['Years'].astype(int).astype(str).str.zfill(2)
+    details['Years'] = year_labels.groupby('Tax ID', observed=True, sort=False)['Years'].agg(', '.join)
+
+    details = details.sort_values(['Total', 'Tax ID'], ascending=[False, True])
 
     return details
\ No newline at end of file
@@ -18,10 +18,26 @@ def parse_amount(amount_str):
     return float(cleaned)
 
 
+def parse_amounts(amounts):
+    """Convert a Series of amount strings to floats, as parse_amount does per value.
+
+    The dollar signs and commas are stripped with vectorized string
+    replaces instead of a Python call per row.
+    """
+    cleaned = amounts.astype("string").str.replace("$", "", regex=False).str.replace(",", "", regex=False)
+    return pd.to_numeric(cleaned.replace("", pd.NA)).fillna(0.0).astype("float64")
+
+
+# The only CSV columns the analysis and reports read
+DONATION_COLUMNS = {"Submit Date", "Amount", "Tax ID", "Organization", "Charitable Sector", "Recurring"}
+
+
 def read_donation_data(file_path):
     """Read and parse the CSV donation data"""
     try:
-        df = pd.read_csv(file_path, skiprows=8)
+        # Other export columns are never parsed; names are matched stripped,
+        # since the header may pad them with spaces
+        df = pd.read_csv(file_path, skiprows=8, usecols=lambda column: column.strip() in DONATION_COLUMNS)
     except FileNotFoundError:
         raise FileNotFoundError(f"data.csv file not found at {file_path}")
 
@@ -29,11 +45,24 @@ def read_donation_data(file_path):
     df.columns = df.columns.str.strip()
 
     # Convert amount column to numeric
-    df["Amount_Numeric"] = df["Amount"].apply(parse_amount)
+    df["Amount_Numeric"] = parse_amounts(df["Amount"])
+
+    # Convert dates to datetime; Fidelity exports MM/DD/YYYY, and a fixed
+    # format skips pandas' per-value format inference. Exports in any other
+    # date format fall back to inference, as before
+    try:
+        df["Submit Date"] = pd.to_datetime(df["Submit Date"], format="%m/%d/%Y")
+    except ValueError:
+        df["Submit Date"] = pd.to_datetime(df["Submit Date"])
+    # Derived once here; downstream code reads Year instead of re-running .dt.year.
+    # Nullable Int16 keeps the year of a row without a Submit Date missing
+    df["Year"] = df["Submit Date"].dt.year.astype("Int16")
 
-    # Convert dates to datetime
-    df["Submit Date"] = pd.to_datetime(df["Submit Date"])
-    df["Year"] = df["Submit Date"].dt.year
+    # Repeated string keys become integer codes, so groupby and
+    # equality filters on them no longer hash strings
+    for column in ("Tax ID", "Organization", "Charitable Sector", "Recurring"):
+        if column in df.columns:
+            df[column] = df[column].astype("category")
 
     return df
 
@@ -79,25 +79,19 @@ def create_charity_yearly_graphs(charities, charity_details, output_dir):
     images_dir = os.path.join(output_dir, "images")
     os.makedirs(images_dir, exist_ok=True)
 
-    for i, (tax_id, charity_data) in enumerate(charities.iterrows(), 1):
-        donations = charity_details[tax_id].copy()
+    for i, tax_id in enumerate(charities.index, 1):
+        donations = charity_details[tax_id]
 
         # Group by year and sum donations
-        donations["Year"] = donations["Submit Date"].dt.year
-        yearly_totals = donations.groupby("Year")["Amount_Numeric"].sum()
-
-        # Get all years from the data (full history)
-        all_years = sorted(yearly_totals.index)
-        if not all_years:
+        yearly_totals = donations["Amount_Numeric"].groupby(donations["Year"], sort=False).sum()
+        if yearly_totals.empty:
             created_graphs[tax_id] = None
             continue
 
-        # Create complete year range from first to last donation year
-        year_range = list(range(min(all_years), max(all_years) + 1))
-        year_amounts = []
-        for year in year_range:
-            amount = yearly_totals.get(year, 0)
-            year_amounts.append(amount)
+        # Create complete year range from first to last donation year;
+        # years without donations are filled with 0 in one reindex
+        year_range = list(range(yearly_totals.index.min(), yearly_totals.index.max() + 1))
+        year_amounts = yearly_totals.reindex(year_range, fill_value=0).tolist()
 
         _create_single_charity_graph(i, tax_id, year_range, year_amounts, images_dir, created_graphs)
 
@@ -6,6 +6,7 @@ Coordinates data processing, analysis, visualization, and reporting.
 import os
 import shutil
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from fidchar.core import data_processing as dp
 from fidchar.core import analysis as an
 from fidchar.core import visualization as vis
@@ -14,13 +15,19 @@ from fidchar.reports import html_report_builder as hrb
 from fidchar.reports import base_report_builder as brb
 from fidchar.reports.base_report_builder import ReportData
 
+# Prefer libyaml's C parser; PyYAML builds without it fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def load_config():
     """Load configuration from YAML file."""
     config_path = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
     try:
         with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except FileNotFoundError:
         print(f"Warning: {config_path} not found, using defaults")
         return {
@@ -68,42 +75,59 @@ def main():
         # Analyze donation patterns
         one_time, stopped_recur = an.analyze_donation_patterns(df)
 
-        # Get ALL charities by donation amount
-        all_charities = df.groupby("Tax ID").agg({
+        # Get ALL charities by donation amount; equal totals are ordered by
+        # Tax ID, since the unsorted groupby emits them in file order
+        all_charities = df.groupby("Tax ID", observed=True, sort=False).agg({
             "Amount_Numeric": "sum",
             "Organization": "first"
-        }).sort_values("Amount_Numeric", ascending=False)
+        }).sort_values(["Amount_Numeric", "Tax ID"], ascending=[False, True])
 
-        # Get charity evaluations for ALL charities (includes recurring determination)
+        # Get charity evaluations for ALL charities (includes recurring determination).
+        # They are network-bound and independent of the details and graphs below,
+        # so they run in the background while those are built. The with block
+        # joins the evaluation thread even if building details or graphs fails
         evaluator = ev.CharityEvaluator(df, config)
-        char_evals, recurring_ein_set, pattern_based_ein_set = evaluator.get_evaluations(
-            all_charities, one_time, stopped_recur
-        )
+        with ThreadPoolExecutor(max_workers=1) as eval_executor:
+            evals_future = eval_executor.submit(evaluator.get_evaluations, all_charities, one_time, stopped_recur)
 
-        # Filter by minimum grant amount
-        min_grant = config.get("charities_min_grant", 1000)
-        filtered_charities = all_charities[all_charities["Amount_Numeric"] >= min_grant]
+            # Filter by minimum grant amount
+            min_grant = config.get("charities_min_grant", 1000)
+            filtered_charities = all_charities[all_charities["Amount_Numeric"] >= min_grant]
 
-        # Sort based on configuration
-        sort_order = config.get("charities_sort", "alpha")
-        if sort_order == "alpha":
-            filtered_charities = filtered_charities.sort_values("Organization")
-        elif sort_order == "total_grant":
-            filtered_charities = filtered_charities.sort_values("Amount_Numeric", ascending=False)
-        else:
-            # Default to alphabetical if invalid sort order
-            filtered_charities = filtered_charities.sort_values("Organization")
+            # Sort based on configuration
+            sort_order = config.get("charities_sort", "alpha")
+            if sort_order == "alpha":
+                filtered_charities = filtered_charities.sort_values("Organization")
+            elif sort_order == "total_grant":
+                filtered_charities = filtered_charities.sort_values("Amount_Numeric", ascending=False, kind="stable")
+            else:
+                # Default to alphabetical if invalid sort order
+                filtered_charities = filtered_charities.sort_values("Organization")
 
-        # Get detailed info for ALL filtered charities
-        char_details = an.get_charity_details(df, filtered_charities)
-        graph_info = vis.create_charity_yearly_graphs(filtered_charities, char_details, output_dir)
+            # Get detailed info for ALL filtered charities
+            char_details = an.get_charity_details(df, filtered_charities)
+            graph_info = vis.create_charity_yearly_graphs(filtered_charities, char_details, output_dir)
 
+            char_evals, recurring_ein_set, pattern_based_ein_set = evals_future.result()
 
         # Optionally export charity data to CSV for external processing
         export_csv_cfg = config.get("export_csv", {})
         if export_csv_cfg.get("enabled", False):
             output_csv = export_csv_cfg.get("output_file", "output/charity_export.csv")
             os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+            # Donation history for every evaluated charity from one sort and
+            # groupby, instead of filtering df once per charity
+            history_df = df[df["Tax ID"].isin(list(char_evals))].sort_values("Submit Date", ascending=False)
+            history = history_df.groupby("Tax ID", observed=True, sort=False).agg(
+                MostRecentAmount=("Amount_Numeric", "first"),
+                MostRecentDate=("Submit Date", "first"),
+                TotalDonations=("Amount_Numeric", "sum")
+            )
+            history_years = history_df[["Tax ID", "Year"]].dropna().drop_duplicates().sort_values("Year")
+            history["DonationYears"] = history_years.groupby("Tax ID", observed=True, sort=False)["Year"].agg(
+                lambda years: ", ".join(str(y) for y in years))
+            donation_history = {ein: values for ein, *values in history.itertuples(name=None)}
+
             # Prepare rows: EIN, Name, Mission, Budget, Geography, Alignment, Most Recent Amount, Most Recent Date, Is Recurring
             rows = []
             for ein, eval_obj in char_evals.items():
@@ -124,16 +148,10 @@ def main():
                             service_area = str(service_areas_data)
                 alignment = getattr(eval_obj, 'alignment_score', None)
                 # Donation history info
-                org_df = df[df["Tax ID"] == ein]
-                if not org_df.empty:
-                    most_recent_row = org_df.sort_values("Submit Date", ascending=False).iloc[0]
-                    most_recent_amt = most_recent_row["Amount_Numeric"]
-                    most_recent_date = most_recent_row["Submit Date"].strftime("%Y-%m-%d")
-                    # Years with donations (sorted)
-                    years = sorted(org_df["Submit Date"].dt.year.unique())
-                    donation_years = ", ".join(str(y) for y in years)
-                    # Total donations ever
-                    total_donations = org_df["Amount_Numeric"].sum()
+                ein_history = donation_history.get(ein)
+                if ein_history is not None:
+                    most_recent_amt, most_recent_date, total_donations, donation_years = ein_history
+                    most_recent_date = most_recent_date.strftime("%Y-%m-%d")
                 else:
                     most_recent_amt = ''
                     most_recent_date = ''
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class ReportTable:
     title: str | None
     columns: list[str]
@@ -21,17 +21,14 @@ class ReportTable:
         recurring_column: str | None = None,
         alignment_column: str | None = None,
     ):
-        df = df.copy()
-
-        # Extract recurring flags
+        # Flag columns are read out and dropped from the rendered columns;
+        # the caller's frame is never mutated, so no defensive copy is needed
         recurring_flags = df[recurring_column].tolist() if recurring_column and recurring_column in df.columns else [False] * len(df)
-        if recurring_column and recurring_column in df.columns:
-            df.drop(columns=[recurring_column], inplace=True)
-
-        # Extract alignment flags
         alignment_flags = df[alignment_column].tolist() if alignment_column and alignment_column in df.columns else [None] * len(df)
-        if alignment_column and alignment_column in df.columns:
-            df.drop(columns=[alignment_column], inplace=True)
+
+        flag_columns = [column for column in (recurring_column, alignment_column) if column and column in df.columns]
+        if flag_columns:
+            df = df.drop(columns=flag_columns)
 
         return cls(
             title=title,
@@ -44,7 +41,7 @@ class ReportTable:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CardSection:
     """A section within a card - can be text, key-value pairs, list, table, etc."""
     section_type: str  # "text", "key_value", "list", "table"
@@ -52,7 +49,7 @@ class CardSection:
     title: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportCard:
     """Represents a Bootstrap card component - completely general and reusable"""
     title: str
@@ -3,9 +3,22 @@
 This module contains shared logic for extracting and processing data,
 independent of output format (HTML, Markdown, Text).
 """
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from operator import itemgetter
 import pandas as pd
 
+# Alignment badge tiers: a score at or above ALIGNMENT_THRESHOLDS[i] earns
+# ALIGNMENT_BADGES[i + 1]
+ALIGNMENT_THRESHOLDS = (30, 50, 70, 90)
+ALIGNMENT_BADGES = (
+    {"stars": "⭐", "bg_color": "#9e9e9e", "text_color": "#fff"},  # Grey
+    {"stars": "⭐⭐", "bg_color": "#81c784", "text_color": "#fff"},  # Soft light green
+    {"stars": "⭐⭐⭐", "bg_color": "#66bb6a", "text_color": "#fff"},  # Medium green
+    {"stars": "⭐⭐⭐⭐", "bg_color": "#43a047", "text_color": "#fff"},  # Dark green
+    {"stars": "⭐⭐⭐⭐⭐", "bg_color": "#00c853", "text_color": "#fff"},  # Pure green
+)
+
 
 @dataclass
 class ReportData:
@@ -27,6 +40,9 @@ class BaseReportBuilder:
         self.charity_evaluations = report_data.evaluations
         self.recurring_ein_set = report_data.recurring_ein_set
         self.pattern_based_ein_set = report_data.pattern_based_ein_set
+        self._charity_rows_cache = None
+        # Set by report generation from analyze_donation_patterns' result
+        self.stopped_recurring = None
 
     def extract_charity_details(self, tax_id):
         """Extract common charity details - single implementation"""
@@ -184,10 +200,7 @@ class BaseReportBuilder:
 
         Returns: 'aligned' if score >= 70, 'not_aligned' if score < 70, None if no evaluation
         """
-        if not self.charity_evaluations or ein not in self.charity_evaluations:
-            return None
-
-        evaluation = self.charity_evaluations[ein]
+        evaluation = self.charity_evaluations.get(ein) if self.charity_evaluations else None
         alignment_score = getattr(evaluation, 'alignment_score', None)
 
         if alignment_score is None:
@@ -201,16 +214,11 @@ class BaseReportBuilder:
         Returns: dict with 'stars', 'bg_color', 'text_color'
         Color scheme: Grey (1 star) -> Light Green -> Medium Green -> Dark Green -> Pure Green (5 stars)
         """
-        if alignment_score >= 90:
-            return {"stars": "⭐⭐⭐⭐⭐", "bg_color": "#00c853", "text_color": "#fff"}  # Pure green
-        elif alignment_score >= 70:
-            return {"stars": "⭐⭐⭐⭐", "bg_color": "#43a047", "text_color": "#fff"}  # Dark green
-        elif alignment_score >= 50:
-            return {"stars": "⭐⭐⭐", "bg_color": "#66bb6a", "text_color": "#fff"}  # Medium green
-        elif alignment_score >= 30:
-            return {"stars": "⭐⭐", "bg_color": "#81c784", "text_color": "#fff"}  # Soft light green
-        else:
-            return {"stars": "⭐", "bg_color": "#9e9e9e", "text_color": "#fff"}  # Grey
+        # A NaN score compares False like the old >= chain did, so it must
+        # not reach bisect, which would rank it above every threshold
+        if not alignment_score >= ALIGNMENT_THRESHOLDS[0]:
+            return dict(ALIGNMENT_BADGES[0])
+        return dict(ALIGNMENT_BADGES[bisect_right(ALIGNMENT_THRESHOLDS, alignment_score)])
 
     def format_charity_info(self, ein, org_name, total_donated=None):
         """Generate charity info with HTML formatting.
@@ -225,11 +233,11 @@ class BaseReportBuilder:
         """
         is_recurring = self.is_recurring_charity(ein)
         alignment_status = self.get_alignment_status(ein)
+        evaluation = self.charity_evaluations.get(ein)
 
         # Get Charity Navigator URL if available, fix URL format, or fallback to ProPublica
         profile_url = None
-        if ein in self.charity_evaluations:
-            evaluation = self.charity_evaluations[ein]
+        if evaluation is not None:
             cn_url = evaluation.data_field_values.get('charity_navigator_url')
             if cn_url:
                 # Fix Charity Navigator URL to include 'www' subdomain
@@ -258,8 +266,7 @@ class BaseReportBuilder:
             badges_html += f" <span class=\"charity-badge\">CONSDR</span>"
 
         # Alignment badge with percentage
-        if ein in self.charity_evaluations:
-            evaluation = self.charity_evaluations[ein]
+        if evaluation is not None:
             alignment_score = getattr(evaluation, 'alignment_score', None)
 
             if alignment_score is not None and alignment_score > 0:
@@ -291,10 +298,9 @@ class BaseReportBuilder:
         focus = self.get_recurring_charities()
         total = 0.0
         for ein in focus.keys():
-            if ein in self.charity_details:
-                org_df = self.charity_details[ein]
-                if not org_df.empty and 'Amount_Numeric' in org_df.columns:
-                    total += org_df['Amount_Numeric'].sum()
+            org_df = self.charity_details.get(ein)
+            if org_df is not None and not org_df.empty and 'Amount_Numeric' in org_df.columns:
+                total += org_df['Amount_Numeric'].sum()
         return len(focus), total
 
     def build_focus_rows(self):
@@ -304,7 +310,7 @@ class BaseReportBuilder:
         for ein, evaluation in focus.items():
             org_df = self.charity_details.get(ein)
             if org_df is not None and not org_df.empty:
-                years = sorted(org_df['Year'].unique()) if 'Year' in org_df.columns else []
+                years = sorted(org_df['Year'].dropna().unique()) if 'Year' in org_df.columns else []
                 first_year = years[0] if years else None
                 last_year = years[-1] if years else None
                 period = f"{first_year}-{last_year}" if first_year and last_year else "—"
@@ -325,7 +331,7 @@ class BaseReportBuilder:
                 'alignment_score': getattr(evaluation, 'alignment_score', None),
             })
         # sort by total donated desc
-        rows.sort(key=lambda r: r['total_donated'], reverse=True)
+        rows.sort(key=itemgetter('total_donated'), reverse=True)
         return rows
 
     def prepare_recurring_summary_data(self, max_shown=20):
@@ -340,23 +346,22 @@ class BaseReportBuilder:
         if not self.recurring_ein_set:
             return None
 
-        rows = []
-        for ein in self.recurring_ein_set:
-            org_df = self.df[self.df['Tax ID'] == ein]
-            if not org_df.empty:
-                org_name = org_df['Organization'].iloc[0]
-                total_donated = org_df['Amount_Numeric'].sum() if 'Amount_Numeric' in org_df.columns else 0.0
-                last_date = org_df['Submit Date'].max() if 'Submit Date' in org_df.columns else None
-
-                rows.append({
-                    'ein': ein,
-                    'organization': org_name,
-                    'last_date': last_date,
-                    'total_donated': total_donated
-                })
+        # One groupby over the recurring charities' rows rather than a
+        # full-frame scan per EIN
+        recurring_df = self.df[self.df['Tax ID'].isin(self.recurring_ein_set)]
+        stats = recurring_df.groupby('Tax ID', observed=True, sort=False).agg(
+            organization=('Organization', 'first'),
+            total_donated=('Amount_Numeric', 'sum'),
+            last_date=('Submit Date', 'max')
+        )
+
+        rows = [
+            {'ein': ein, 'organization': org_name, 'last_date': last_date, 'total_donated': total_donated}
+            for ein, org_name, total_donated, last_date in stats.itertuples(name=None)
+        ]
 
-        # Sort by total donated descending
-        rows.sort(key=lambda r: r['total_donated'], reverse=True)
+        # Sort by total donated descending, then by EIN for equal totals
+        rows.sort(key=lambda r: (-r['total_donated'], r['ein']))
 
         # Limit to max_shown
         total_count = len(rows)
@@ -382,15 +387,15 @@ class BaseReportBuilder:
             max_shown: Maximum number to show (default: 100)
         """
         # Get all charities grouped
-        all_charities = self.df.groupby('Tax ID').agg({
+        all_charities = self.df.groupby('Tax ID', observed=True, sort=False).agg({
             'Amount_Numeric': 'sum',
             'Organization': 'first',
             'Submit Date': 'max'
         }).reset_index()
 
         # Count donations and unique years for each
-        donation_counts = self.df.groupby('Tax ID').size()
-        unique_years = self.df.groupby('Tax ID')['Year'].nunique()
+        donation_counts = self.df.groupby('Tax ID', observed=True, sort=False).size()
+        unique_years = self.df.groupby('Tax ID', observed=True, sort=False)['Year'].nunique()
 
         all_charities['donation_count'] = all_charities['Tax ID'].map(donation_counts)
         all_charities['unique_years'] = all_charities['Tax ID'].map(unique_years)
@@ -405,10 +410,10 @@ class BaseReportBuilder:
             (~all_charities['Tax ID'].isin(self.recurring_ein_set)) &  # Not recurring
             (~all_charities['Tax ID'].isin(charity_eins)) &  # Not in filtered charities
             (~all_charities['Tax ID'].isin(one_time_eins))  # Not one-time
-        ].copy()
+        ]
 
-        # Sort by total amount
-        remaining = remaining.sort_values('Amount_Numeric', ascending=False)
+        # Sort by total amount, then by Tax ID for equal totals
+        remaining = remaining.sort_values(['Amount_Numeric', 'Tax ID'], ascending=[False, True])
 
         total_count = len(remaining)
         total_amount = remaining['Amount_Numeric'].sum()
@@ -450,22 +455,11 @@ class BaseReportBuilder:
         """
         from fidchar.core import analysis as an
 
-        # Get stopped recurring EINs FIRST (from analyze_donation_patterns)
-        from datetime import datetime
-        current_year = datetime.now().year
-        org_donations = self.df.groupby("Tax ID").agg({
-            "Amount_Numeric": ["sum", "count"],
-            "Submit Date": ["min", "max"],
-            "Recurring": "first",
-            "Organization": "first"
-        }).round(2)
-        org_donations.columns = ["Total_Amount", "Donation_Count", "First_Date", "Last_Date", "Recurring_Status", "Organization_Name"]
-
-        stopped_recurring = org_donations[
-            (org_donations["Donation_Count"] > 1) &
-            (org_donations["Last_Date"].dt.year < current_year - 1) &
-            (org_donations["Recurring_Status"].str.contains("annually|semi-annually", case=False, na=False))
-        ]
+        # Get stopped recurring EINs FIRST (from analyze_donation_patterns);
+        # reuse the report's own result rather than re-aggregating self.df
+        stopped_recurring = self.stopped_recurring
+        if stopped_recurring is None:
+            _, stopped_recurring = an.analyze_donation_patterns(self.df)
         stopped_eins = set(stopped_recurring.index)
 
         # Get CSV recurring EINs (excluding stopped ones)
@@ -481,13 +475,24 @@ class BaseReportBuilder:
         if not all_eins:
             return None
 
+        # Totals, counts and two-digit year labels for every charity in one pass
+        combined_df = self.df[self.df['Tax ID'].isin(all_eins)]
+        stats = combined_df.groupby('Tax ID', observed=True, sort=False).agg(
+            Organization=('Organization', 'first'),
+            Total=('Amount_Numeric', 'sum'),
+            Count=('Amount_Numeric', 'size')
+        )
+        year_labels = pd.DataFrame({
+            'Tax ID': combined_df['Tax ID'],
+            'Years': combined_df['Year']
+        }).dropna().drop_duplicates()
+        year_labels['Years'] = year_labels['Years'].astype(int).astype(str).str[-2:]
+        year_labels = year_labels.sort_values('Years')
+        stats['Years'] = year_labels.groupby('Tax ID', observed=True, sort=False)['Years'].agg(', '.join)
+
         # Build combined data
         rows = []
-        for ein in all_eins:
-            org_df = self.df[self.df['Tax ID'] == ein]
-            if org_df.empty:
-                continue
-
+        for ein, org_name, total, count, years in stats.itertuples(name=None):
             # Determine source
             in_csv = ein in csv_eins
             in_rule = ein in rule_eins
@@ -514,12 +519,6 @@ class BaseReportBuilder:
             else:
                 source = 'rule'
 
-            # Get charity details
-            org_name = org_df['Organization'].iloc[0]
-            total = org_df['Amount_Numeric'].sum()
-            count = len(org_df)
-            years = ', '.join(sorted(set(str(y)[-2:] for y in org_df['Year'])))
-
             rows.append({
                 'EIN': ein,
                 'Organization': org_name,
@@ -529,10 +528,10 @@ class BaseReportBuilder:
                 'Source': source
             })
 
-        # Create DataFrame and sort by total
+        # Create DataFrame and sort by total, then by EIN for equal totals
         result_df = pd.DataFrame(rows)
         result_df = result_df.set_index('EIN')
-        result_df = result_df.sort_values('Total', ascending=False)
+        result_df = result_df.sort_values(['Total', 'EIN'], ascending=[False, True])
 
         # Limit to max_shown
         if len(result_df) > max_shown:
@@ -540,6 +539,45 @@ class BaseReportBuilder:
 
         return result_df
 
+    def _charity_rows(self):
+        """Per-charity totals, years and counts, sorted by total donated.
+
+        Several sections list every charity, so the rows are built once per
+        builder and reused.
+        """
+        if self._charity_rows_cache is not None:
+            return self._charity_rows_cache
+
+        # Use the most recent year in the data, not current calendar year
+        current_year = self.df['Year'].max()
+
+        # Totals, counts, year labels and current-year amounts for every
+        # charity from groupbys, instead of a full-frame scan per charity
+        all_charities = self.df.groupby('Tax ID', observed=True, sort=False).agg(
+            Organization=('Organization', 'first'),
+            Total=('Amount_Numeric', 'sum'),
+            Count=('Amount_Numeric', 'size')
+        ).sort_values(['Total', 'Tax ID'], ascending=[False, True])
+        year_labels = pd.DataFrame({
+            'Tax ID': self.df['Tax ID'],
+            'Year': self.df['Year']
+        }).dropna().drop_duplicates().sort_values('Year')
+        year_labels['Year'] = year_labels['Year'].astype(int).astype(str).str[-2:]
+        all_charities['Years'] = year_labels.groupby('Tax ID', observed=True, sort=False)['Year'].agg(', '.join)
+        is_current = (self.df['Year'] == current_year).to_numpy(dtype=bool, na_value=False)
+        current_totals = self.df.loc[is_current, 'Amount_Numeric'].groupby(
+            self.df.loc[is_current, 'Tax ID'], observed=True, sort=False).sum()
+        all_charities['Current'] = current_totals.reindex(all_charities.index, fill_value=0.0)
+
+        rows = [
+            {'EIN': ein, 'Organization': org_name, 'Total': total,
+             'Years': years, 'Current': current, 'Count': count}
+            for ein, org_name, total, count, years, current in all_charities.itertuples(name=None)
+        ]
+
+        self._charity_rows_cache = rows
+        return rows
+
     def prepare_all_charities_data(self, csv_recurring_df, max_shown=None, filter_func=None):
         """Prepare comprehensive list of all charities with detailed columns.
 
@@ -570,25 +608,12 @@ class BaseReportBuilder:
         # Get rule-based recurring EINs (pattern-based only, not combined)
         rule_eins = self.pattern_based_ein_set
 
-        # Get all charities
-        all_charities = self.df.groupby('Tax ID').agg({
-            'Organization': 'first',
-            'Amount_Numeric': 'sum'
-        }).sort_values('Amount_Numeric', ascending=False)
-
         # Use the most recent year in the data, not current calendar year
         current_year = self.df['Year'].max()
 
         rows = []
-        for ein, row in all_charities.iterrows():
-            charity_df = self.df[self.df['Tax ID'] == ein]
-
-            # Get years donated (as 2-digit strings, sorted)
-            years = sorted(set(charity_df['Year'].astype(int)))
-            years_str = ', '.join(str(y)[-2:] for y in years)
-
-            # Get most recent year donation amount
-            amount_current_year = charity_df[charity_df['Year'] == current_year]['Amount_Numeric'].sum()
+        for row in self._charity_rows():
+            ein = row['EIN']
 
             # Check if in CSV or Rule
             in_csv = ein in csv_eins
@@ -604,11 +629,11 @@ class BaseReportBuilder:
             rows.append({
                 'EIN': ein,
                 'Organization': row['Organization'],
-                'Total': row['Amount_Numeric'],
+                'Total': row['Total'],
                 'Rule': "✓" if in_rule else "",
-                'Years': years_str,
-                f'{current_year}': amount_current_year,
-                'Count': len(charity_df)
+                'Years': row['Years'],
+                f'{current_year}': row['Current'],
+                'Count': row['Count']
             })
 
         # Create DataFrame
@@ -4,8 +4,8 @@
 Handles all charapi dependencies and evaluation calls.
 """
 
-import yaml
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from charapi.api.charity_evaluator import batch_evaluate
 from fidchar.core import analysis as an
 
@@ -23,6 +23,24 @@ class CharityEvaluator:
         self.donation_df = donation_df
         self.charapi_config_path = config.get("charapi_config_path")
         self.recurring_config = config.get("recurring_charity", {})
+        self.max_workers = config.get("charapi_max_workers", 8)
+
+    def _batch_evaluate(self, charity_list):
+        """Evaluate charities as concurrent batches, returning results in input order.
+
+        Evaluations are network-bound, so the list is split into one batch per
+        worker and the batches run on a thread pool; max_workers of 1 keeps a
+        single serial batch.
+        """
+        workers = max(1, min(self.max_workers, len(charity_list)))
+        if workers == 1:
+            return batch_evaluate(charity_list, self.charapi_config_path)
+
+        size = -(-len(charity_list) // workers)
+        batches = [charity_list[i:i + size] for i in range(0, len(charity_list), size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_results = executor.map(lambda batch: batch_evaluate(batch, self.charapi_config_path), batches)
+            return [result for results in batch_results for result in results]
 
     def get_evaluations(self, charities, one_time=None, stopped_recurring=None):
         """Fetch charity evaluations from charapi.
@@ -79,8 +97,8 @@ class CharityEvaluator:
         charity_list = list(charities_to_evaluate)
 
         try:
-            # Evaluate all charities at once with shared config/clients
-            results = batch_evaluate(charity_list, self.charapi_config_path)
+            # Evaluate in concurrent batches; each batch shares its config/clients
+            results = self._batch_evaluate(charity_list)
 
             # Convert list results to dict
             evaluations = {ein: result for ein, result in zip(charity_list, results)}
@@ -31,6 +31,22 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
         self.table_renderer = HTMLSectionRenderer()
         self.card_renderer = HTMLCardRenderer()
 
+        # Parse the configured sections once; generate_report looks them up by name
+        self.sections = [
+            (section if isinstance(section, str) else section.get("name"), _extract_section_options(section))
+            for section in config.get("sections", [])
+        ]
+
+    def _enabled_section_options(self, section_name):
+        """Return options of the first section with this name, or None if absent or excluded.
+
+        The include flag defaults to True when not specified.
+        """
+        for name, options in self.sections:
+            if name == section_name:
+                return None if options.get("include", True) == False else options
+        return None
+
     def generate_html_header_section(self, options=None):
         """Generate the custom header and executive summary sections for fidchar report.
          """
@@ -91,17 +107,18 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
 {cards_section}
     </div>"""
 
-    def _build_html_document(self, custom_header, custom_footer):
-        """Build a complete HTML document with Bootstrap CSS.
+    def _html_document_parts(self, body_parts):
+        """Build a complete HTML document with Bootstrap CSS, as a list of parts.
 
         Uses instance configuration for document title, CSS files, and container class.
+        The body parts are placed between the document's opening and closing
+        markup as-is, so the caller can write them out without joining them.
 
         Args:
-            custom_header: HTML content for header section
-            custom_footer: HTML content for footer section
+            body_parts: List of HTML strings for the container body
 
         Returns:
-            Complete HTML document string
+            List of strings that concatenate to the complete HTML document
         """
         # Document configuration (constant for this report type)
         doc_title = "Charitable Donation Analysis Report"
@@ -109,14 +126,9 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
         css_files = ["colors.css", "styles.css"]
 
         # Build CSS links for external files
-        css_links = ""
-        for css_file in css_files:
-            css_links += f'  <link rel="stylesheet" href="{css_file}">\n'
-
-        header_block = custom_header if custom_header else ""
-        footer_block = custom_footer if custom_footer else ""
+        css_links = "".join(f'  <link rel="stylesheet" href="{css_file}">\n' for css_file in css_files)
 
-        return f"""<!DOCTYPE html>
+        document_start = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -126,12 +138,13 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
 {css_links}</head>
 <body class="small">
 <div class="{container_class}">
-{header_block}
-{footer_block}
+"""
+        document_end = """
 </div>
 <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
 </body>
 </html>"""
+        return [document_start, *body_parts, document_end]
 
     def _render_two_column_table(self, df_data, title=None):
         """Render DataFrame data as two-column layout for print.
@@ -190,27 +203,10 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
         self.recurring_min_years = pattern_config.get('min_years', 6)
         self.recurring_min_amount = pattern_config.get('min_amount', 1000)
 
-        # Get exec section options from config
-        exec_options = {}
-        exec_enabled = False
-        sections = self.config.get("sections", [])
-        for section in sections:
-            section_name = section if isinstance(section, str) else section.get("name")
-            if section_name == "exec":
-                exec_enabled = True
-                if isinstance(section, dict):
-                    section_opts = _extract_section_options(section)
-                    # Check include flag: defaults to True if not specified
-                    include = section_opts.get("include", True)
-                    if include == False:
-                        exec_enabled = False
-                        break
-                    exec_options = section_opts
-                break
-
         # Generate custom header only if exec section is enabled
+        exec_options = self._enabled_section_options("exec")
         custom_header = ""
-        if exec_enabled:
+        if exec_options is not None:
             custom_header = self.generate_html_header_section(exec_options)
 
         # Generate sections HTML (excluding definitions which will be added at the end)
@@ -221,24 +217,12 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
         )
 
         # Check if detailed section should be included
-        detailed_enabled = False
-        detailed_max_shown = None
-        for section in sections:
-            section_name = section if isinstance(section, str) else section.get("name")
-            if section_name == "detailed":
-                detailed_enabled = True
-                if isinstance(section, dict):
-                    section_opts = _extract_section_options(section)
-                    # Check include flag: defaults to True if not specified
-                    include = section_opts.get("include", True)
-                    if include == False:
-                        detailed_enabled = False
-                    # Get max_shown option
-                    detailed_max_shown = section_opts.get("max_shown")
-                break
+        detailed_options = self._enabled_section_options("detailed")
+        detailed_enabled = detailed_options is not None
+        detailed_max_shown = detailed_options.get("max_shown") if detailed_enabled else None
 
         # Generate charity cards section only if enabled
-        charity_cards_html = ""
+        card_parts = []
         if detailed_enabled:
             # Determine how many charities to show
             charities_to_show = charities.head(detailed_max_shown) if detailed_max_shown else charities
@@ -251,37 +235,24 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
             else:
                 title_text = f"Detailed Analysis ({num_shown} charities)"
 
-            charity_cards_html = f"""
+            card_parts.append(f"""
     <div class="report-section section-detailed">
         <h2 class="section-title">{title_text}</h2>
         <p>Complete donation history and trend analysis for each charity:</p>
-"""
-            for i, (tax_id, _) in enumerate(charities_to_show.iterrows(), 1):
-                charity_cards_html += self.generate_charity_card_bootstrap(i, tax_id)
-            charity_cards_html += "\n    </div>"
+""")
+            # Totals come from the charities frame rather than re-summing each history
+            for i, (tax_id, total_donated) in enumerate(charities_to_show["Amount_Numeric"].items(), 1):
+                card_parts.append(self.generate_charity_card_bootstrap(i, tax_id, total_donated))
+            card_parts.append("\n    </div>")
 
         # Check if definitions section should be included
-        definitions_enabled = False
-        for section in sections:
-            section_name = section if isinstance(section, str) else section.get("name")
-            if section_name == "definitions":
-                definitions_enabled = True
-                if isinstance(section, dict):
-                    section_opts = _extract_section_options(section)
-                    # Check include flag: defaults to True if not specified
-                    include = section_opts.get("include", True)
-                    if include == False:
-                        definitions_enabled = False
-                break
+        definitions_enabled = self._enabled_section_options("definitions") is not None
 
         # Generate definitions section (at the very end) only if enabled
         definitions_html = ""
         if definitions_enabled:
             definitions_html = generate_definitions_section()
 
-        # Combine body content: sections + charity cards + definitions
-        body_content = f"{sections_html}\n{charity_cards_html}\n{definitions_html}"
-
         # Generate footer
         custom_footer = """
     <footer class="mt-5 pt-3 border-top text-center text-muted">
@@ -292,11 +263,13 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
         # colors.css: Color definitions (minimal, mostly empty)
         # styles.css: All screen and print styles (includes @media print section)
 
-        # Build complete HTML document
-        html_content = self._build_html_document(
-            custom_header=custom_header + body_content,
-            custom_footer=custom_footer
-        )
+        # Body content: header + sections + charity cards + definitions, then footer.
+        # The parts are written to the file in order rather than first
+        # concatenated into one report-sized string
+        document_parts = self._html_document_parts([
+            custom_header, sections_html, "\n", *card_parts, "\n", definitions_html,
+            "\n", custom_footer
+        ])
 
         # Get output directory from config
         output_dir = self.config.get("output_dir", "output")
@@ -309,7 +282,7 @@ class HTMLReportBuilder(HTMLSectionGeneratorsMixin, brb.BaseReportBuilder):
 
         html_file_path = os.path.join(output_dir, "donation_analysis.html")
         with open(html_file_path, "w") as f:
-            f.write(html_content)
+            f.writelines(document_parts)
 
 
 # Helper functions for section generation
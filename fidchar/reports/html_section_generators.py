@@ -40,9 +40,9 @@ class HTMLSectionGeneratorsMixin:
         df.columns = ['Charitable Sector', 'Total Amount']
 
         if show_percentages:
-            df['Percentage'] = (df['Total Amount'] / total_amount * 100).apply(lambda x: f"{x:.1f}%")
+            df['Percentage'] = (df['Total Amount'] / total_amount * 100).map("{:.1f}%".format)
 
-        df['Total Amount'] = df['Total Amount'].apply(lambda x: f"${x:,.0f}")
+        df['Total Amount'] = df['Total Amount'].map("${:,.0f}".format)
 
         table = ReportTable.from_dataframe(
             df,
@@ -52,10 +52,11 @@ class HTMLSectionGeneratorsMixin:
 
     def generate_yearly_table_bootstrap(self, yearly_amounts, yearly_counts):
         """Generate yearly analysis table using Bootstrap renderer"""
+        amounts = yearly_amounts.sort_index()
         df = pd.DataFrame({
-            'Year': sorted(yearly_amounts.index),
-            'Total Amount': [f"${yearly_amounts[year]:,.0f}" for year in sorted(yearly_amounts.index)],
-            'Number of Donations': [yearly_counts[year] for year in sorted(yearly_amounts.index)]
+            'Year': amounts.index,
+            'Total Amount': amounts.map("${:,.0f}".format).to_numpy(),
+            'Number of Donations': yearly_counts.reindex(amounts.index).to_numpy()
         })
 
         table = ReportTable.from_dataframe(
@@ -313,8 +314,12 @@ class HTMLSectionGeneratorsMixin:
             total=data['total']
         )
 
-    def generate_charity_card_bootstrap(self, i, tax_id):
-        """Generate charity detail as Bootstrap card"""
+    def generate_charity_card_bootstrap(self, i, tax_id, total_donated=None):
+        """Generate charity detail as Bootstrap card
+
+        total_donated may be passed in when the caller already has the
+        charity's total, saving a re-sum of its donation history.
+        """
         org_donations = self.charity_details[tax_id]
         has_graph = self.graph_info.get(tax_id) is not None
         evaluation = self.charity_evaluations.get(tax_id)
@@ -325,7 +330,8 @@ class HTMLSectionGeneratorsMixin:
             description = "No description available"
 
         org_name = org_donations["Organization"].iloc[0] if not org_donations.empty else "Unknown"
-        total_donated = org_donations["Amount_Numeric"].sum()
+        if total_donated is None:
+            total_donated = org_donations["Amount_Numeric"].sum()
         donation_count = len(org_donations)
 
         # Get most recent donation info
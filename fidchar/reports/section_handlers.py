@@ -161,7 +161,7 @@ def generate_table_sections(config: dict, builder=None, exclude_definitions=Fals
     All handlers access data through the builder instance.
     """
     sections = config.get("sections", {})
-    html_content = ""
+    html_parts = []
 
     # Compute csv_recurring_df once (used by multiple sections)
     csv_recurring_df = None
@@ -203,9 +203,9 @@ def generate_table_sections(config: dict, builder=None, exclude_definitions=Fals
 
             handler = handlers.get(section_id)
             if handler:
-                html_content += handler()
+                html_parts.append(handler())
 
-    return html_content
+    return "".join(html_parts)
 
 
 def generate_definitions_section():
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Tests for core analysis functions.
+
+These tests verify the business logic of data analysis,
+NOT the report formatting/structure.
+"""
+
+import pytest
+import pandas as pd
+from datetime import datetime
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'fidchar'))
+
+from core.analysis import (
+    analyze_by_category,
+    analyze_by_year,
+    annual_recurring_mask,
+    get_charities_basic,
+    get_charity_details,
+    get_csv_recurring_details,
+    get_recurring_by_pattern
+)
+
+
+def build_df(rows):
+    df = pd.DataFrame(rows)
+    df['Submit Date'] = pd.to_datetime(df['Submit Date'])
+    df['Year'] = df['Submit Date'].dt.year
+    return df
+
+
+@pytest.fixture(scope='module')
+def sample_df():
+    """Create sample donation data for testing (shared; tests must not mutate it)"""
+    data = {
+        'Tax ID': ['11-1111111', '22-2222222', '11-1111111', '33-3333333', '22-2222222'],
+        'Organization': ['Charity A', 'Charity B', 'Charity A', 'Charity C', 'Charity B'],
+        'Amount_Numeric': [1000.0, 500.0, 1500.0, 750.0, 600.0],
+        'Charitable Sector': ['Education', 'Health', 'Education', 'Environment', 'Health'],
+        'Year': [2024, 2024, 2025, 2024, 2025],
+        'Submit Date': pd.to_datetime(['2024-01-15', '2024-03-20', '2025-02-10', '2024-05-01', '2025-01-05']),
+        'Recurring': ['annually through indefinitely', '', 'annually through indefinitely', '', 'semi-annually through indefinitely']
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope='module')
+def pattern_df():
+    """Donation history covering the last few years for three charities (shared)"""
+    current_year = datetime.now().year
+    rows = []
+    # Charity A: $1000 every year for the last 5 years, including last year
+    for offset in range(1, 6):
+        rows.append({'Tax ID': '11-1111111', 'Amount_Numeric': 1000.0,
+                     'Submit Date': f'{current_year - offset}-03-01'})
+    # Charity B: 5 qualifying years, but nothing last year
+    for offset in range(2, 7):
+        rows.append({'Tax ID': '22-2222222', 'Amount_Numeric': 1000.0,
+                     'Submit Date': f'{current_year - offset}-03-01'})
+    # Charity C: gives every year, but only reaches the minimum by summing two gifts
+    for offset in range(1, 6):
+        rows.append({'Tax ID': '33-3333333', 'Amount_Numeric': 600.0,
+                     'Submit Date': f'{current_year - offset}-01-15'})
+        rows.append({'Tax ID': '33-3333333', 'Amount_Numeric': 400.0,
+                     'Submit Date': f'{current_year - offset}-07-15'})
+    return build_df(rows)
+
+
+class TestAnalyzeByCategory:
+    """Test sector totals"""
+
+    def test_totals_by_sector(self, sample_df):
+        result = analyze_by_category(sample_df)
+        assert result['Education'] == 2500.0
+        assert result['Health'] == 1100.0
+        assert result['Environment'] == 750.0
+
+    def test_sorted_by_amount_descending(self, sample_df):
+        result = analyze_by_category(sample_df)
+        assert list(result.index) == ['Education', 'Health', 'Environment']
+
+
+class TestAnalyzeByYear:
+    """Test yearly totals and counts"""
+
+    def test_amounts_and_counts(self, sample_df):
+        amounts, counts = analyze_by_year(sample_df)
+        assert amounts[2024] == 2250.0
+        assert amounts[2025] == 2100.0
+        assert counts[2024] == 3
+        assert counts[2025] == 2
+
+    def test_sorted_by_year(self, sample_df):
+        amounts, counts = analyze_by_year(sample_df.iloc[::-1])
+        assert list(amounts.index) == [2024, 2025]
+        assert list(counts.index) == [2024, 2025]
+
+
+class TestGetCharitiesBasic:
+    """Test charity totals grouped by Tax ID"""
+
+    def test_returns_all_charities_by_default(self, sample_df):
+        result = get_charities_basic(sample_df)
+        assert len(result) == 3
+
+    def test_respects_max_count(self, sample_df):
+        result = get_charities_basic(sample_df, max_count=2)
+        assert list(result.index) == ['11-1111111', '22-2222222']
+
+    def test_sorted_by_amount_descending(self, sample_df):
+        for max_count in (None, 10):
+            amounts = get_charities_basic(sample_df, max_count)['Amount_Numeric'].values
+            assert all(amounts[i] >= amounts[i+1] for i in range(len(amounts)-1))
+
+    def test_groups_by_tax_id(self, sample_df):
+        result = get_charities_basic(sample_df)
+        assert result.loc['11-1111111']['Amount_Numeric'] == 2500.0
+        assert result.loc['11-1111111']['Organization'] == 'Charity A'
+
+    def test_categorical_tax_id(self, sample_df):
+        sample_df = sample_df.astype({'Tax ID': 'category'})
+        result = get_charities_basic(sample_df, max_count=2)
+        assert list(result.index) == ['11-1111111', '22-2222222']
+
+
+class TestGetCharityDetails:
+    """Test per-charity donation history"""
+
+    def test_keys_follow_charity_order(self, sample_df):
+        charities = get_charities_basic(sample_df)
+        result = get_charity_details(sample_df, charities)
+        assert list(result) == list(charities.index)
+
+    def test_history_sorted_by_date(self, sample_df):
+        charities = get_charities_basic(sample_df)
+        history = get_charity_details(sample_df.iloc[::-1], charities)['22-2222222']
+        assert list(history['Amount_Numeric']) == [500.0, 600.0]
+        assert history['Submit Date'].is_monotonic_increasing
+
+    def test_same_day_donations_keep_file_order(self):
+        rows = [
+            {'Tax ID': '11-1111111', 'Amount_Numeric': amount, 'Submit Date': date,
+             'Charitable Sector': 'Education', 'Organization': 'Charity A'}
+            for amount, date in [(1000.0, '2024-05-01'), (50.0, '2024-05-01'),
+                                 (200.0, '2023-01-01'), (75.0, '2024-05-01')]
+        ]
+        # Other charities' rows make the sort large enough to expose an unstable sort
+        rows += [{'Tax ID': f'{i:02d}-0000000', 'Amount_Numeric': 1.0, 'Submit Date': '2024-05-01',
+                  'Charitable Sector': 'Health', 'Organization': f'Other {i}'} for i in range(40)]
+        df = build_df(rows)
+        history = get_charity_details(df, get_charities_basic(df))['11-1111111']
+        assert list(history['Amount_Numeric']) == [200.0, 1000.0, 50.0, 75.0]
+
+    def test_only_requested_charities(self, sample_df):
+        charities = get_charities_basic(sample_df, max_count=1)
+        result = get_charity_details(sample_df, charities)
+        assert list(result) == ['11-1111111']
+        assert len(result['11-1111111']) == 2
+
+
+class TestGetRecurringByPattern:
+    """Test pattern-based recurring charity detection"""
+
+    def test_returns_set(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1000)
+        assert isinstance(result, set)
+
+    def test_includes_charity_meeting_all_rules(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1000)
+        assert '11-1111111' in result
+
+    def test_requires_previous_year_donation(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1000)
+        assert '22-2222222' not in result
+
+    def test_sums_donations_within_a_year(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1000)
+        assert '33-3333333' in result
+
+    def test_respects_min_years(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 6, 1000)
+        assert result == set()
+
+    def test_respects_min_amount(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1500)
+        assert result == set()
+
+    def test_ignores_years_outside_window(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df, 3, 5, 1000)
+        assert result == set()
+
+    def test_derives_year_when_missing(self, pattern_df):
+        result = get_recurring_by_pattern(pattern_df.drop(columns=['Year']), 10, 5, 1000)
+        assert result == {'11-1111111', '33-3333333'}
+
+    def test_categorical_tax_id(self, pattern_df):
+        pattern_df = pattern_df.astype({'Tax ID': 'category'})
+        result = get_recurring_by_pattern(pattern_df, 10, 5, 1000)
+        assert result == {'11-1111111', '33-3333333'}
+
+    def test_empty_dataframe(self):
+        empty_df = pd.DataFrame({
+            'Tax ID': pd.Series(dtype=object),
+            'Amount_Numeric': pd.Series(dtype=float),
+            'Submit Date': pd.Series(dtype='datetime64[ns]'),
+            'Year': pd.Series(dtype=int),
+        })
+        assert get_recurring_by_pattern(empty_df, 10, 5, 1000) == set()
+
+
+class TestGetCsvRecurringDetails:
+    """Test details for charities marked recurring in the CSV"""
+
+    def test_only_recurring_charities(self, sample_df):
+        result = get_csv_recurring_details(sample_df)
+        assert set(result.index) == {'11-1111111', '22-2222222'}
+
+    def test_aggregates_recurring_rows(self, sample_df):
+        result = get_csv_recurring_details(sample_df)
+        assert result.loc['11-1111111', 'Total'] == 2500.0
+        assert result.loc['11-1111111', 'Count'] == 2
+        assert result.loc['22-2222222', 'Total'] == 600.0
+
+    def test_years_are_sorted_two_digit_labels(self, sample_df):
+        result = get_csv_recurring_details(sample_df)
+        assert result.loc['11-1111111', 'Years'] == '24, 25'
+        assert result.loc['22-2222222', 'Years'] == '25'
+
+    def test_returns_none_without_recurring_column(self, sample_df):
+        assert get_csv_recurring_details(sample_df.drop(columns=['Recurring'])) is None
+
+
+class TestAnnualRecurringMask:
+    """Test matching of annual and semi-annual Recurring values"""
+
+    def test_matches_annual_schedules(self):
+        status = pd.Series(['Annually through indefinitely', '', 'semi-annually through 2030',
+                            'monthly through indefinitely', None])
+        assert annual_recurring_mask(status).tolist() == [True, False, True, False, False]
+
+    def test_categorical_status(self, sample_df):
+        mask = annual_recurring_mask(sample_df['Recurring'].astype('category'))
+        assert mask.tolist() == [True, False, True, False, True]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -13,7 +13,7 @@ from io import StringIO
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'fidchar'))
 
-from core.data_processing import parse_amount, read_donation_data
+from core.data_processing import parse_amount, parse_amounts, read_donation_data
 
 
 class TestParseAmount:
@@ -47,6 +47,20 @@ class TestParseAmount:
         assert parse_amount("$1,500") == 1500.0
 
 
+class TestParseAmounts:
+    """Test vectorized amount parsing"""
+
+    def test_matches_parse_amount(self):
+        values = ["$100.00", "$1,000.00", "$10,000,000.50", "500.75", "$1,500", "$0.00"]
+        result = parse_amounts(pd.Series(values))
+        assert result.tolist() == [parse_amount(v) for v in values]
+
+    def test_missing_values_are_zero(self):
+        result = parse_amounts(pd.Series(["", None, "$5.00"]))
+        assert result.tolist() == [0.0, 0.0, 5.0]
+        assert result.dtype == "float64"
+
+
 class TestReadDonationData:
     """Test CSV reading and data cleaning"""
 
@@ -179,6 +193,83 @@ Submit Date,Amount,Tax ID
         finally:
             os.unlink(temp_path)
 
+    def test_stores_tax_id_as_category(self):
+        csv_data = """GRANT HISTORY
+
+Giving Account,Test Fund
+
+Timeframe:,Since inception
+
+As of:,12/28/2025 7:38 PM ET
+
+Submit Date,Amount,Tax ID
+01/15/2024,$100.00,11-1111111
+03/20/2025,$200.00,11-1111111"""
+
+        import tempfile
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_data)
+            temp_path = f.name
+
+        try:
+            df = read_donation_data(temp_path)
+            assert isinstance(df['Tax ID'].dtype, pd.CategoricalDtype)
+            assert df['Tax ID'].iloc[0] == '11-1111111'
+        finally:
+            os.unlink(temp_path)
+
+    def test_empty_submit_date_leaves_year_missing(self):
+        csv_data = """GRANT HISTORY
+
+Giving Account,Test Fund
+
+Timeframe:,Since inception
+
+As of:,12/28/2025 7:38 PM ET
+
+Submit Date,Amount,Tax ID
+01/15/2024,$100.00,11-1111111
+,$200.00,22-2222222"""
+
+        import tempfile
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_data)
+            temp_path = f.name
+
+        try:
+            df = read_donation_data(temp_path)
+            assert len(df) == 2
+            assert df['Year'].iloc[0] == 2024
+            assert pd.isna(df['Submit Date'].iloc[1])
+            assert pd.isna(df['Year'].iloc[1])
+        finally:
+            os.unlink(temp_path)
+
+    def test_off_format_dates_fall_back_to_inference(self):
+        csv_data = """GRANT HISTORY
+
+Giving Account,Test Fund
+
+Timeframe:,Since inception
+
+As of:,12/28/2025 7:38 PM ET
+
+Submit Date,Amount,Tax ID
+2024-01-15,$100.00,11-1111111
+2025-03-20,$200.00,22-2222222"""
+
+        import tempfile
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_data)
+            temp_path = f.name
+
+        try:
+            df = read_donation_data(temp_path)
+            assert df['Submit Date'].iloc[0] == pd.Timestamp('2024-01-15')
+            assert df['Year'].iloc[1] == 2025
+        finally:
+            os.unlink(temp_path)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
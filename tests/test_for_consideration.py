@@ -167,6 +167,23 @@ class TestForConsideration:
         assert result is True
 
 
+class TestAlignmentBadgeInfo:
+    """Test star tiers for alignment scores"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        report_data = ReportData(charity_details={}, graph_info={}, evaluations={})
+        self.builder = BaseReportBuilder(df=pd.DataFrame(), config={}, report_data=report_data)
+
+    def test_tiers_by_threshold(self):
+        stars = [self.builder.get_alignment_badge_info(score)['stars']
+                 for score in (0, 29, 30, 50, 70, 89, 90, 100)]
+        assert [len(s) for s in stars] == [1, 1, 2, 3, 4, 4, 5, 5]
+
+    def test_nan_score_gets_lowest_tier(self):
+        assert self.builder.get_alignment_badge_info(float('nan'))['stars'] == '⭐'
+
+
 class TestForConsiderationBadge:
     """Test FOR CONSIDERATION badge display"""
 
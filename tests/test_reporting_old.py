@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Tests for the archived plain-text report tables.
+
+These tests verify table contents, NOT exact spacing.
+"""
+
+import pytest
+import pandas as pd
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'archive'))
+
+from reporting_old import create_top_charities_table
+
+
+class TestCreateTopCharitiesTable:
+    """Test the top charities ranking table"""
+
+    def test_categorical_tax_id_index(self):
+        top_charities = pd.DataFrame(
+            {'Organization': ['Charity A', 'Charity B'], 'Amount_Numeric': [2000.0, 1000.0]},
+            index=pd.CategoricalIndex(['11-1111111', '22-2222222'], name='Tax ID')
+        )
+        table = create_top_charities_table(top_charities)
+        assert '11-1111111' in table
+        assert '22-2222222' in table
+
+    def test_missing_tax_id_shown_as_na(self):
+        top_charities = pd.DataFrame(
+            {'Organization': ['Charity A', 'Charity B'], 'Amount_Numeric': [2000.0, 1000.0]},
+            index=pd.CategoricalIndex(['11-1111111', None], name='Tax ID')
+        )
+        table = create_top_charities_table(top_charities)
+        assert table.splitlines()[-1].endswith('N/A')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])